@@ -2,25 +2,63 @@
 API package initialization
 """
 
-from flask import Flask
+import hashlib
+import os
+import orjson
+from flask import Flask, Response, request
+from flask.json.provider import JSONProvider
+from flask_compress import Compress
 from flask_cors import CORS
 from api.routes.calendar_routes import calendar_routes
 from api.routes.chat_routes import chat_routes
 from config.settings import DEBUG, HOST, PORT
 
+class OrjsonProvider(JSONProvider):
+    """orjson-backed serialization for every jsonify response"""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
 def create_app():
     """Create and configure the Flask application"""
     app = Flask(__name__, template_folder='../templates')
+    app.json = OrjsonProvider(app)
     CORS(app)
+    Compress(app)
 
     # Register blueprints
     app.register_blueprint(calendar_routes, url_prefix='/api')
     app.register_blueprint(chat_routes, url_prefix='/api')
 
+    # Preload the single-page frontend so '/' serves from memory instead of
+    # touching the filesystem on every request. A strong ETag lets repeat
+    # visitors get a bodyless 304 instead of the full page.
+    static_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'static')
+    try:
+        with open(os.path.join(static_dir, 'index.html'), 'rb') as f:
+            index_html = f.read()
+        index_etag = hashlib.md5(index_html).hexdigest()
+    except OSError as e:
+        print(f"Warning: could not preload index.html: {e}")
+        index_html = None
+        index_etag = None
+
+    index_headers = {
+        'ETag': index_etag,
+        'Cache-Control': 'public, max-age=60'
+    }
+
     # Register main route
     @app.route('/')
     def index():
         """Serve the main calendar interface"""
+        if index_html is not None:
+            if request.headers.get('If-None-Match') == index_etag:
+                return Response(status=304, headers=index_headers)
+            return Response(index_html, mimetype='text/html', headers=index_headers)
         return app.send_static_file('index.html')
 
     return app 
\ No newline at end of file
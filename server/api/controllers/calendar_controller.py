@@ -5,8 +5,40 @@ Calendar controller handling calendar operations
 from flask import jsonify
 from datetime import datetime, timedelta
 import pytz
+import time
 from services.calendar.calendar_service import CalendarService
-from utils.time.time_utils import format_events_for_display
+from utils.time.time_utils import format_events_for_display, to_rfc3339
+from utils.cache.cache_utils import TTLCache
+from config.settings import EVENTS_CACHE_TTL_SECONDS
+
+# Resolve the UTC timezone object once instead of per request
+UTC = pytz.UTC
+
+# Short-TTL cache for the formatted event payload. The window start is
+# rounded to the minute so repeated polls within the TTL share one key
+# instead of recomputing the time-range strings and refetching upstream.
+_events_cache = TTLCache(EVENTS_CACHE_TTL_SECONDS)
+
+def _fetch_formatted_events(service):
+    """Get the formatted 7-day event list, via the short-TTL cache.
+
+    The cache key is just the current minute as an int — cache hits cost one
+    integer division instead of building datetimes and strftime strings. The
+    window datetimes are only constructed on a miss.
+    """
+    cache_key = int(time.time() // 60)
+    formatted_events = _events_cache.get(cache_key)
+    if formatted_events is None:
+        start_date = datetime.now(UTC).replace(second=0, microsecond=0)
+        end_date = start_date + timedelta(days=7)
+
+        events = service.get_events(
+            start_time=to_rfc3339(start_date),
+            end_time=to_rfc3339(end_date)
+        )
+        formatted_events = format_events_for_display(events)
+        _events_cache.set(cache_key, formatted_events)
+    return formatted_events
 
 class CalendarController:
     def __init__(self):
@@ -18,19 +50,34 @@ class CalendarController:
         try:
             if not self.service.is_available():
                 return jsonify({'error': 'Calendar not available'}), 500
-            
+
             # Get events for the next 7 days by default
-            start_date = datetime.now(pytz.UTC)
-            end_date = start_date + timedelta(days=7)
-            
-            start_time = start_date.strftime('%Y-%m-%dT%H:%M:%S.000Z')
-            end_time = end_date.strftime('%Y-%m-%dT%H:%M:%S.000Z')
-            
-            events = self.service.get_events(start_time=start_time, end_time=end_time)
-            formatted_events = format_events_for_display(events)
-            
+            formatted_events = _fetch_formatted_events(self.service)
+
             return jsonify({'events': formatted_events})
-            
+
         except Exception as e:
             print(f"Error getting events: {e}")
+            return jsonify({'error': str(e)}), 500
+
+    def get_batch(self):
+        """Get events and calendars in one aggregated response
+
+        Lets the frontend hydrate with a single round-trip instead of one
+        request per resource.
+        """
+        try:
+            if not self.service.is_available():
+                return jsonify({'error': 'Calendar not available'}), 500
+
+            formatted_events = _fetch_formatted_events(self.service)
+            calendars = self.service.get_calendars()
+
+            return jsonify({
+                'events': formatted_events,
+                'calendars': calendars
+            })
+
+        except Exception as e:
+            print(f"Error getting batch data: {e}")
             return jsonify({'error': str(e)}), 500 
\ No newline at end of file
@@ -2,13 +2,13 @@
 Chat controller handling chat operations
 """
 
-from flask import jsonify, request
-from services.chatbot.chatbot_service import ChatbotService
+from flask import Response, jsonify, request, stream_with_context
+from services.chatbot.chatbot_service import get_chatbot_service
 
 class ChatController:
     def __init__(self):
-        """Initialize chat controller"""
-        self.service = ChatbotService()
+        """Initialize chat controller with the shared chatbot service"""
+        self.service = get_chatbot_service()
 
     def process_message(self):
         """Process chat messages"""
@@ -29,4 +29,38 @@ class ChatController:
             
         except Exception as e:
             print(f"Error in chat: {e}")
+            return jsonify({'error': str(e)}), 500
+
+    def stream_message(self):
+        """Stream a chat reply as Server-Sent Events.
+
+        Plain-text replies render progressively in the client instead of
+        waiting for the full completion; the stream ends with a [DONE]
+        sentinel.
+        """
+        try:
+            if not self.service.is_available():
+                return jsonify({'error': 'Chatbot not available. Please check OpenAI API key.'}), 500
+
+            data = request.get_json()
+            message = data.get('message', '').strip()
+
+            if not message:
+                return jsonify({'error': 'Message cannot be empty'}), 400
+
+            def event_stream():
+                for chunk in self.service.stream_message(message):
+                    # SSE frames one "data:" line per text line
+                    for line in chunk.split('\n'):
+                        yield f"data: {line}\n"
+                    yield "\n"
+                yield "data: [DONE]\n\n"
+
+            return Response(
+                stream_with_context(event_stream()),
+                mimetype='text/event-stream'
+            )
+
+        except Exception as e:
+            print(f"Error in chat stream: {e}")
             return jsonify({'error': str(e)}), 500 
\ No newline at end of file
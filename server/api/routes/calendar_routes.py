@@ -17,4 +17,9 @@ def get_events():
 @calendar_routes.route('/refresh')
 def refresh_events():
     """Refresh calendar events"""
-    return controller.get_events() 
\ No newline at end of file
+    return controller.get_events()
+
+@calendar_routes.route('/batch')
+def get_batch():
+    """Get events and calendars in a single aggregated response"""
+    return controller.get_batch() 
\ No newline at end of file
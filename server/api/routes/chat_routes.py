@@ -11,4 +11,9 @@ controller = ChatController()
 @chat_routes.route('/chat', methods=['POST'])
 def chat():
     """Handle chat messages"""
-    return controller.process_message() 
\ No newline at end of file
+    return controller.process_message()
+
+@chat_routes.route('/chat/stream', methods=['POST'])
+def chat_stream():
+    """Stream chat replies as Server-Sent Events"""
+    return controller.stream_message() 
\ No newline at end of file
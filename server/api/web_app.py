@@ -1,26 +1,62 @@
 """
-Web application API endpoints
+Web application API endpoints (ASGI)
 """
 
-from flask import Flask, render_template, request, jsonify
-from flask_cors import CORS
+import asyncio
+import hashlib
+import os
+import threading
+import uvicorn
+from fastapi import FastAPI, Request, Response
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import FileResponse, ORJSONResponse, StreamingResponse
+from pydantic import BaseModel
 from services.chatbot.calendar_chatbot_gpt import CalendarGPTBot
 from services.calendar.calendar_handler import CalendarHandler
+from utils.time.time_utils import format_events_for_display, to_rfc3339
 from datetime import datetime, timedelta
 import pytz
-import os
 from config.settings import (
     OPENAI_API_KEY,
     DEBUG,
     HOST,
     PORT,
     GOOGLE_CREDENTIALS_FILE,
-    GOOGLE_TOKEN_FILE
+    GOOGLE_TOKEN_FILE,
+    EVENTS_CACHE_TTL_SECONDS
+)
+
+# Initialize FastAPI app; uvicorn serves it without a WSGI worker per request.
+# ORJSONResponse encodes every payload with orjson (Rust encoder) instead of
+# the stdlib json module, matching the Flask app's orjson provider.
+app = FastAPI(title="AI Calendar", default_response_class=ORJSONResponse)
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=['*'],
+    allow_methods=['*'],
+    allow_headers=['*']
 )
 
-# Initialize Flask app with correct template directory
-app = Flask(__name__, static_folder='../static')
-CORS(app)
+STATIC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'static')
+
+# Preload the single-page frontend so '/' serves from memory; the strong
+# ETag lets repeat visitors get a bodyless 304 instead of the full page
+try:
+    with open(os.path.join(STATIC_DIR, 'index.html'), 'rb') as f:
+        _index_bytes = f.read()
+    _index_etag = hashlib.md5(_index_bytes).hexdigest()
+except OSError as e:
+    print(f"Warning: could not preload index.html: {e}")
+    _index_bytes = None
+    _index_etag = None
+
+_index_headers = {
+    'ETag': _index_etag or '',
+    'Cache-Control': 'public, max-age=60'
+}
+
+# Resolve UTC once instead of per request
+UTC = pytz.UTC
 
 # Initialize the chatbot and calendar handler
 if not OPENAI_API_KEY:
@@ -33,105 +69,157 @@ else:
         print(f"Error initializing chatbot: {e}")
         chatbot = None
 
-# Initialize calendar handler for direct calendar access
+# Calendar handler for direct calendar access. Authentication is deferred
+# to the first request so worker startup doesn't block on the OAuth flow
+# or a token refresh; the outcome is cached for the life of the process.
 calendar_handler = CalendarHandler()
-try:
-    calendar_handler.authenticate()
-except Exception as e:
-    print(f"Error authenticating calendar: {e}")
-    calendar_handler = None
+_handler_ready = None
+_handler_lock = threading.Lock()
+
+def _ensure_calendar_handler() -> bool:
+    """Authenticate the calendar handler once, on first use"""
+    global _handler_ready
+    if _handler_ready is None:
+        with _handler_lock:
+            if _handler_ready is None:
+                try:
+                    _handler_ready = bool(calendar_handler.authenticate())
+                except Exception as e:
+                    print(f"Error authenticating calendar: {e}")
+                    _handler_ready = False
+    return _handler_ready
 
-@app.route('/')
-def index():
+@app.get('/')
+async def index(request: Request):
     """Serve the main calendar interface"""
-    return app.send_static_file('index.html')
+    if _index_bytes is None:
+        return FileResponse(os.path.join(STATIC_DIR, 'index.html'))
+    if request.headers.get('if-none-match') == _index_etag:
+        return Response(status_code=304, headers=_index_headers)
+    return Response(content=_index_bytes, media_type='text/html', headers=_index_headers)
+
+# Latest formatted 7-day event list, maintained by a background refresh
+# task so /api/events answers from memory instead of calling Google per
+# request. A single reference assignment is atomic in CPython, so readers
+# need no lock.
+_events_snapshot = None
+
+def _fetch_events_snapshot():
+    """Fetch the next 7 days from Google, format, and update the snapshot"""
+    global _events_snapshot
+    start_date = datetime.now(UTC)
+    end_date = start_date + timedelta(days=7)
 
-@app.route('/api/events')
+    events = calendar_handler.get_events(
+        start_time=to_rfc3339(start_date),
+        end_time=to_rfc3339(end_date)
+    )
+    _events_snapshot = format_events_for_display(events)
+    return _events_snapshot
+
+async def _refresh_events_loop():
+    """Keep the events snapshot fresh, decoupled from user poll rate"""
+    while True:
+        try:
+            if _ensure_calendar_handler():
+                await asyncio.to_thread(_fetch_events_snapshot)
+        except Exception as e:
+            print(f"Error refreshing events snapshot: {e}")
+        await asyncio.sleep(EVENTS_CACHE_TTL_SECONDS)
+
+@app.on_event('startup')
+async def _start_refresh_loop():
+    asyncio.create_task(_refresh_events_loop())
+
+@app.get('/api/events')
 def get_events():
     """Get calendar events for display"""
     try:
-        if not calendar_handler:
-            return jsonify({'error': 'Calendar not available'}), 500
-        
-        # Get events for the next 7 days by default
-        start_date = datetime.now(pytz.UTC)
-        end_date = start_date + timedelta(days=7)
-        
-        start_time = start_date.strftime('%Y-%m-%dT%H:%M:%S.000Z')
-        end_time = end_date.strftime('%Y-%m-%dT%H:%M:%S.000Z')
-        
-        events = calendar_handler.get_events(start_time=start_time, end_time=end_time)
-        
-        # Format events for frontend
-        formatted_events = []
-        for event in events:
-            try:
-                start = event.get('start', {}).get('dateTime', '')
-                end = event.get('end', {}).get('dateTime', '')
-                
-                # Convert to local time for display
-                if start:
-                    start_dt = datetime.fromisoformat(start.replace('Z', '+00:00'))
-                    local_start = start_dt.astimezone(pytz.timezone('Asia/Kolkata'))
-                    start_formatted = local_start.strftime('%Y-%m-%d %H:%M')
-                else:
-                    start_formatted = 'Unknown'
-                
-                if end:
-                    end_dt = datetime.fromisoformat(end.replace('Z', '+00:00'))
-                    local_end = end_dt.astimezone(pytz.timezone('Asia/Kolkata'))
-                    end_formatted = local_end.strftime('%H:%M')
-                else:
-                    end_formatted = 'Unknown'
-                
-                formatted_events.append({
-                    'id': event.get('id', ''),
-                    'title': event.get('summary', 'Untitled Event'),
-                    'start': start_formatted,
-                    'end': end_formatted,
-                    'description': event.get('description', ''),
-                    'location': event.get('location', ''),
-                    'day': local_start.strftime('%A, %B %d') if start else 'Unknown'
-                })
-            except Exception as e:
-                print(f"Error formatting event: {e}")
-                continue
-        
-        return jsonify({'events': formatted_events})
-        
+        # Served straight from the background-refreshed snapshot; the only
+        # synchronous Google call is the cold start before the first refresh
+        snapshot = _events_snapshot
+        if snapshot is not None:
+            return {'events': snapshot}
+
+        if not _ensure_calendar_handler():
+            return ORJSONResponse(status_code=500, content={'error': 'Calendar not available'})
+
+        return {'events': _fetch_events_snapshot()}
+
     except Exception as e:
         print(f"Error getting events: {e}")
-        return jsonify({'error': str(e)}), 500
+        return ORJSONResponse(status_code=500, content={'error': str(e)})
 
-@app.route('/api/chat', methods=['POST'])
-def chat():
+class ChatRequest(BaseModel):
+    """Chat request body; parsed and validated by FastAPI in one pass
+    instead of a dict lookup per field in the handler"""
+    message: str
+
+@app.post('/api/chat')
+async def chat(data: ChatRequest):
     """Handle chat messages"""
     try:
         if not chatbot:
-            return jsonify({'error': 'Chatbot not available. Please check OpenAI API key.'}), 500
-        
-        data = request.get_json()
-        message = data.get('message', '').strip()
-        
+            return ORJSONResponse(
+                status_code=500,
+                content={'error': 'Chatbot not available. Please check OpenAI API key.'}
+            )
+
+        message = data.message.strip()
+
         if not message:
-            return jsonify({'error': 'Message cannot be empty'}), 400
-        
-        # Process the message with the chatbot
-        response = chatbot.process_query(message)
-        
-        return jsonify({'response': response})
-        
+            return ORJSONResponse(status_code=400, content={'error': 'Message cannot be empty'})
+
+        # Process the message with the chatbot without blocking the event loop
+        response = await chatbot.aprocess_query(message)
+
+        return {'response': response}
+
     except Exception as e:
         print(f"Error in chat: {e}")
-        return jsonify({'error': str(e)}), 500
+        return ORJSONResponse(status_code=500, content={'error': str(e)})
 
-@app.route('/api/refresh')
+@app.post('/api/chat/stream')
+async def chat_stream(data: ChatRequest):
+    """Handle chat messages, streaming the reply via Server-Sent Events"""
+    if not chatbot:
+        return ORJSONResponse(
+            status_code=500,
+            content={'error': 'Chatbot not available. Please check OpenAI API key.'}
+        )
+
+    message = data.message.strip()
+
+    if not message:
+        return ORJSONResponse(status_code=400, content={'error': 'Message cannot be empty'})
+
+    async def event_stream():
+        try:
+            async for chunk in chatbot.aprocess_query_stream(message):
+                # SSE data lines cannot contain raw newlines; split multi-line
+                # chunks into consecutive data: lines of one event
+                for line in chunk.split('\n'):
+                    yield f"data: {line}\n"
+                yield "\n"
+        except Exception as e:
+            print(f"Error in chat stream: {e}")
+        yield "data: [DONE]\n\n"
+
+    return StreamingResponse(event_stream(), media_type='text/event-stream')
+
+@app.get('/api/refresh')
 def refresh_events():
-    """Refresh calendar events"""
-    return get_events()
+    """Force a snapshot refresh instead of waiting for the background loop"""
+    try:
+        if not _ensure_calendar_handler():
+            return ORJSONResponse(status_code=500, content={'error': 'Calendar not available'})
+        return {'events': _fetch_events_snapshot()}
+    except Exception as e:
+        print(f"Error refreshing events: {e}")
+        return ORJSONResponse(status_code=500, content={'error': str(e)})
 
 if __name__ == '__main__':
     print("Starting Calendar Web App...")
     print("Make sure your OpenAI API key is set in the .env file")
     print("Access the app at: http://localhost:5001")
-    app.run(debug=True, host='0.0.0.0', port=5001) 
\ No newline at end of file
+    uvicorn.run(app, host='0.0.0.0', port=5001)
@@ -10,7 +10,23 @@ def main():
     app = create_app()
     print("Starting AI Calendar Server...")
     print(f"Access the app at: http://{HOST}:{PORT}")
-    app.run(debug=DEBUG, host=HOST, port=PORT)
+
+    if DEBUG:
+        # Keep the Flask dev server in debug mode for the reloader/debugger
+        app.run(debug=DEBUG, host=HOST, port=PORT)
+        return
+
+    try:
+        # Serve through uvicorn; loop='auto' picks uvloop when installed,
+        # which handles concurrent connections with far less event-loop
+        # overhead than the single-threaded Werkzeug dev server.
+        import uvicorn
+        from asgiref.wsgi import WsgiToAsgi
+
+        uvicorn.run(WsgiToAsgi(app), host=HOST, port=PORT, loop='auto')
+    except ImportError:
+        print("uvicorn/asgiref not installed, falling back to the Flask dev server")
+        app.run(debug=DEBUG, host=HOST, port=PORT)
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
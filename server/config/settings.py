@@ -4,17 +4,25 @@ Server configuration settings
 
 import os
 from pathlib import Path
-from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
+# Load environment variables; skipped when the launcher already parsed the
+# .env file into os.environ (it sets this sentinel). The dotenv import
+# lives inside the guard so a pre-seeded process never pays for importing
+# the package at all.
+if not os.environ.get('AI_CALENDAR_DOTENV_LOADED'):
+    from dotenv import load_dotenv
+    load_dotenv()
 
 # Base directory
 BASE_DIR = Path(__file__).resolve().parent.parent
 
 # OpenAI settings
 OPENAI_API_KEY = os.getenv('OPENAI_API_KEY')
-OPENAI_MODEL = "gpt-3.5-turbo"
+OPENAI_MODEL = "gpt-4o-mini"
+OPENAI_EMBEDDING_MODEL = "text-embedding-3-small"
+OPENAI_MAX_COMPLETION_TOKENS = 256  # tool routing emits calls, not prose
+OPENAI_MAX_CONCURRENCY = 4        # simultaneous in-flight OpenAI calls
+OPENAI_REQUESTS_PER_MINUTE = 60   # client-side rate limit
 
 # Google Calendar settings
 GOOGLE_CREDENTIALS_FILE = 'credentials.json'
@@ -34,6 +42,7 @@ DEFAULT_TIMEZONE = 'UTC'
 
 # Calendar settings
 DEFAULT_CALENDAR_ID = 'primary'
+EVENTS_CACHE_TTL_SECONDS = 30  # how long /api/events responses stay cached
 DEFAULT_EVENT_DURATION = 60  # minutes
 WORKING_HOURS = {
     'start': 9,  # 9 AM
@@ -45,5 +54,6 @@ API_PREFIX = '/api'
 ENDPOINTS = {
     'events': f'{API_PREFIX}/events',
     'chat': f'{API_PREFIX}/chat',
-    'refresh': f'{API_PREFIX}/refresh'
+    'refresh': f'{API_PREFIX}/refresh',
+    'batch': f'{API_PREFIX}/batch'
 } 
\ No newline at end of file
@@ -6,9 +6,22 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional
 
-@dataclass
+# Converted events keyed by (id, etag). Google bumps the etag whenever an
+# event changes, so a matching entry can be reused without re-parsing.
+_EVENT_CACHE_MAX_SIZE = 256
+
+# Display format for event times, shared by all instances
+DISPLAY_TIME_FMT = "%B %d, %Y at %I:%M %p"
+_event_cache = {}
+
+@dataclass(slots=True)
 class Event:
-    """Calendar event data model"""
+    """Calendar event data model
+
+    Slotted so cached events carry a compact field array instead of a
+    per-instance __dict__; matters once hundreds of events sit in the
+    conversion cache.
+    """
     id: str
     title: str
     start_time: datetime
@@ -19,6 +32,23 @@ class Event:
     @classmethod
     def from_google_event(cls, google_event: dict) -> 'Event':
         """Create Event from Google Calendar event"""
+        cache_key = (google_event.get('id'), google_event.get('etag') or google_event.get('updated'))
+        if all(cache_key):
+            cached = _event_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        event = cls._parse_google_event(google_event)
+
+        if all(cache_key):
+            if len(_event_cache) >= _EVENT_CACHE_MAX_SIZE:
+                _event_cache.pop(next(iter(_event_cache)))
+            _event_cache[cache_key] = event
+        return event
+
+    @classmethod
+    def _parse_google_event(cls, google_event: dict) -> 'Event':
+        """Parse a Google Calendar event payload (cache miss path)"""
         return cls(
             id=google_event.get('id', ''),
             title=google_event.get('summary', 'Untitled Event'),
@@ -43,4 +73,4 @@ class Event:
         """Format datetime for display"""
         if timezone:
             dt = dt.astimezone(timezone)
-        return dt.strftime("%B %d, %Y at %I:%M %p") 
\ No newline at end of file
+        return dt.strftime(DISPLAY_TIME_FMT) 
\ No newline at end of file
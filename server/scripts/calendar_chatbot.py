@@ -6,6 +6,27 @@ import pytz
 import re
 from typing import Tuple, List, Dict, Optional
 
+# Command-parsing patterns compiled once at import. Every query runs several
+# of these, so per-call re.search() recompilation was pure overhead.
+# Format tokens used repeatedly by strptime/strftime, hoisted so the parse
+# table for each format is resolved from one constant instead of inline
+# literals scattered through the handlers
+DATETIME_INPUT_FMT = "%Y-%m-%d %H:%M"
+RFC3339_FMT = '%Y-%m-%dT%H:%M:%S.000Z'
+
+TITLE_RE = re.compile(r'"([^"]*)"')
+SCHEDULE_DATETIME_RE = re.compile(r'(tomorrow|today|\d{4}-\d{2}-\d{2})\s*(?:at)?\s*(\d{1,2}:\d{2})')
+DATE_RE = re.compile(r'(tomorrow|today|\d{4}-\d{2}-\d{2})')
+DURATION_VALUE_RE = re.compile(r'(\d+)\s*(hour|hr|minute|min|m|h)s?')
+# Minutes per unit, keyed by the unit group above; one dict lookup replaces
+# the membership scan over a unit list on every parse
+UNIT_MINUTES = {'hour': 60, 'hr': 60, 'h': 60, 'minute': 1, 'min': 1, 'm': 1}
+FOR_DURATION_RE = re.compile(r'for\s+(\d+\s*(?:hour|hr|minute|min|m|h)s?)')
+DURATION_RE = re.compile(r'(\d+\s*(?:hour|hr|minute|min|m|h)s?)')
+EVENT_ID_RE = re.compile(r'event\s+(\w+)')
+UPDATE_TITLE_RE = re.compile(r'title\s+"([^"]*)"')
+UPDATE_TIME_RE = re.compile(r'time\s+(\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2})')
+
 class CalendarChatbot:
     def __init__(self):
         """Initialize the chatbot with CalendarHandler"""
@@ -30,11 +51,11 @@ class CalendarChatbot:
                 date = datetime.now()
             else:
                 # Try to parse the provided date string
-                date = datetime.strptime(date_str, "%Y-%m-%d %H:%M")
+                date = datetime.strptime(date_str, DATETIME_INPUT_FMT)
             
             # Convert to UTC
             utc_date = date.astimezone(pytz.UTC)
-            return utc_date.strftime('%Y-%m-%dT%H:%M:%S.000Z')
+            return utc_date.strftime(RFC3339_FMT)
         except Exception as e:
             raise ValueError(f"Could not parse date: {date_str}. Please use format: YYYY-MM-DD HH:MM")
 
@@ -42,17 +63,11 @@ class CalendarChatbot:
         """Convert duration string to minutes"""
         try:
             # Extract number and unit
-            match = re.match(r'(\d+)\s*(hour|hr|minute|min|m|h)s?', duration_str.lower())
+            match = DURATION_VALUE_RE.match(duration_str.lower())
             if not match:
                 return 60  # default to 60 minutes
-            
-            number, unit = match.groups()
-            number = int(number)
-            
-            if unit in ['hour', 'hr', 'h']:
-                return number * 60
-            else:
-                return number
+
+            return int(match.group(1)) * UNIT_MINUTES[match.group(2)]
         except:
             return 60  # default to 60 minutes
 
@@ -60,14 +75,14 @@ class CalendarChatbot:
         """Handle scheduling new events"""
         try:
             # Extract title (everything between quotes)
-            title_match = re.search(r'"([^"]*)"', query)
+            title_match = TITLE_RE.search(query)
             if not title_match:
                 return "Please provide event title in quotes. Example: schedule \"Team Meeting\" tomorrow at 10:00 for 1 hour"
             
             title = title_match.group(1)
             
             # Extract date and time
-            date_match = re.search(r'(tomorrow|today|\d{4}-\d{2}-\d{2})\s*(?:at)?\s*(\d{1,2}:\d{2})', query)
+            date_match = SCHEDULE_DATETIME_RE.search(query)
             if not date_match:
                 return "Please specify date and time. Example: tomorrow at 10:00"
             
@@ -75,7 +90,7 @@ class CalendarChatbot:
             start_time = self._parse_datetime(date_str)
             
             # Extract duration
-            duration_match = re.search(r'for\s+(\d+\s*(?:hour|hr|minute|min|m|h)s?)', query)
+            duration_match = FOR_DURATION_RE.search(query)
             duration = self._parse_duration(duration_match.group(1) if duration_match else "1 hour")
             
             # Create event
@@ -109,8 +124,8 @@ class CalendarChatbot:
                 end_time = start_time + timedelta(days=7)
             
             events = self.handler.get_events(
-                start_time=start_time.strftime('%Y-%m-%dT%H:%M:%S.000Z'),
-                end_time=end_time.strftime('%Y-%m-%dT%H:%M:%S.000Z')
+                start_time=start_time.strftime(RFC3339_FMT),
+                end_time=end_time.strftime(RFC3339_FMT)
             )
             
             if not events:
@@ -131,7 +146,7 @@ class CalendarChatbot:
         """Handle finding available time slots"""
         try:
             # Extract date
-            date_match = re.search(r'(tomorrow|today|\d{4}-\d{2}-\d{2})', query)
+            date_match = DATE_RE.search(query)
             if not date_match:
                 return "Please specify a date. Example: find slots tomorrow"
             
@@ -144,7 +159,7 @@ class CalendarChatbot:
                 date = date_str
             
             # Extract duration
-            duration_match = re.search(r'(\d+\s*(?:hour|hr|minute|min|m|h)s?)', query)
+            duration_match = DURATION_RE.search(query)
             duration = self._parse_duration(duration_match.group(1) if duration_match else "1 hour")
             
             slots = self.handler.find_available_slots(
@@ -171,18 +186,18 @@ class CalendarChatbot:
         """Handle updating events"""
         try:
             # Extract event ID (implement a way to reference events)
-            event_id_match = re.search(r'event\s+(\w+)', query)
+            event_id_match = EVENT_ID_RE.search(query)
             if not event_id_match:
                 return "Please specify event ID. Example: update event abc123 title \"New Title\""
             
             event_id = event_id_match.group(1)
             
             # Extract new title if provided
-            title_match = re.search(r'title\s+"([^"]*)"', query)
+            title_match = UPDATE_TITLE_RE.search(query)
             title = title_match.group(1) if title_match else None
             
             # Extract new time if provided
-            time_match = re.search(r'time\s+(\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2})', query)
+            time_match = UPDATE_TIME_RE.search(query)
             start_time = self._parse_datetime(time_match.group(1)) if time_match else None
             
             success = self.handler.update_event(
@@ -203,7 +218,7 @@ class CalendarChatbot:
         """Handle deleting events"""
         try:
             # Extract event ID
-            event_id_match = re.search(r'event\s+(\w+)', query)
+            event_id_match = EVENT_ID_RE.search(query)
             if not event_id_match:
                 return "Please specify event ID. Example: delete event abc123"
             
@@ -247,12 +262,15 @@ class CalendarChatbot:
     def process_query(self, query: str) -> str:
         """Process user query and return response"""
         query = query.strip().lower()
-        
-        # Check for command
-        for cmd, handler in self.commands.items():
-            if query.startswith(cmd):
+
+        # Commands are all single leading words, so one dict lookup on the
+        # first token dispatches in O(1) instead of a startswith scan over
+        # every registered command
+        if query:
+            handler = self.commands.get(query.split(None, 1)[0])
+            if handler:
                 return handler(query)
-        
+
         return "I didn't understand that command. Type 'help' to see available commands."
 
 def main():
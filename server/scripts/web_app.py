@@ -1,19 +1,31 @@
 #!/usr/bin/env python3
 
-from flask import Flask, render_template, request, jsonify
-from flask_cors import CORS
+from quart import Quart, render_template, request, jsonify
+from quart_cors import cors
 from calendar_chatbot_gpt import CalendarGPTBot
 from calendar_handler import CalendarHandler
 from datetime import datetime, timedelta
 import pytz
 import os
-from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
+# Load environment variables unless the launcher already parsed the .env
+# file into os.environ (it sets this sentinel). Importing dotenv inside
+# the guard means a pre-seeded process skips the package import entirely.
+if not os.environ.get('AI_CALENDAR_DOTENV_LOADED'):
+    from dotenv import load_dotenv
+    load_dotenv()
 
-app = Flask(__name__, template_folder='../templates')
-CORS(app)
+# Resolve timezone objects once instead of per event/request
+UTC = pytz.UTC
+DISPLAY_TZ = pytz.timezone('Asia/Kolkata')
+
+def _rfc3339(dt):
+    """RFC 3339 timestamp via the isoformat C fast path (strftime re-parses
+    its format string every call)."""
+    return dt.replace(microsecond=0).isoformat().replace('+00:00', 'Z')
+
+app = Quart(__name__, template_folder='../templates')
+app = cors(app)
 
 # Initialize the chatbot and calendar handler
 api_key = os.getenv('OPENAI_API_KEY')
@@ -36,23 +48,23 @@ except Exception as e:
     calendar_handler = None
 
 @app.route('/')
-def index():
+async def index():
     """Serve the main calendar interface"""
-    return render_template('index.html')
+    return await render_template('index.html')
 
 @app.route('/api/events')
-def get_events():
+async def get_events():
     """Get calendar events for display"""
     try:
         if not calendar_handler:
             return jsonify({'error': 'Calendar not available'}), 500
         
         # Get events for the next 7 days by default
-        start_date = datetime.now(pytz.UTC)
+        start_date = datetime.now(UTC)
         end_date = start_date + timedelta(days=7)
         
-        start_time = start_date.strftime('%Y-%m-%dT%H:%M:%S.000Z')
-        end_time = end_date.strftime('%Y-%m-%dT%H:%M:%S.000Z')
+        start_time = _rfc3339(start_date)
+        end_time = _rfc3339(end_date)
         
         events = calendar_handler.get_events(start_time=start_time, end_time=end_time)
         
@@ -66,14 +78,14 @@ def get_events():
                 # Convert to local time for display
                 if start:
                     start_dt = datetime.fromisoformat(start.replace('Z', '+00:00'))
-                    local_start = start_dt.astimezone(pytz.timezone('Asia/Kolkata'))
+                    local_start = start_dt.astimezone(DISPLAY_TZ)
                     start_formatted = local_start.strftime('%Y-%m-%d %H:%M')
                 else:
                     start_formatted = 'Unknown'
                 
                 if end:
                     end_dt = datetime.fromisoformat(end.replace('Z', '+00:00'))
-                    local_end = end_dt.astimezone(pytz.timezone('Asia/Kolkata'))
+                    local_end = end_dt.astimezone(DISPLAY_TZ)
                     end_formatted = local_end.strftime('%H:%M')
                 else:
                     end_formatted = 'Unknown'
@@ -98,20 +110,20 @@ def get_events():
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/chat', methods=['POST'])
-def chat():
+async def chat():
     """Handle chat messages"""
     try:
         if not chatbot:
             return jsonify({'error': 'Chatbot not available. Please check OpenAI API key.'}), 500
         
-        data = request.get_json()
+        data = await request.get_json()
         message = data.get('message', '').strip()
         
         if not message:
             return jsonify({'error': 'Message cannot be empty'}), 400
         
-        # Process the message with the chatbot
-        response = chatbot.process_query(message)
+        # Process the message with the chatbot without blocking the event loop
+        response = await chatbot.aprocess_query(message)
         
         return jsonify({'response': response})
         
@@ -120,9 +132,9 @@ def chat():
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/refresh')
-def refresh_events():
+async def refresh_events():
     """Refresh calendar events"""
-    return get_events()
+    return await get_events()
 
 if __name__ == '__main__':
     print("Starting Calendar Web App...")
@@ -17,22 +17,173 @@ Usage:
     handler.delete_event(event_id="event_id_here")
 """
 
+import asyncio
+import logging
+import logging.handlers
 import os
 import json
+import queue
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice
 from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime, timedelta
+import ciso8601
+import orjson
 import pytz
+import httplib2
+import google_auth_httplib2
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
+from googleapiclient.model import JsonModel
 from google.auth.transport.requests import Request
 from config.settings import (
     GOOGLE_CREDENTIALS_FILE,
     GOOGLE_TOKEN_FILE,
     GOOGLE_CALENDAR_SCOPES,
-    DEFAULT_CALENDAR_ID
+    DEFAULT_CALENDAR_ID,
+    EVENTS_CACHE_TTL_SECONDS
 )
+from utils.cache.cache_utils import TTLCache
+
+# Queue-backed logging: the hot path only enqueues the record, and a
+# background listener thread does the formatting and stdout write, so
+# API calls never block on line-buffered I/O (print held the GIL for
+# every write). Success chatter on per-event paths sits at DEBUG, so
+# production runs skip even the message formatting.
+logger = logging.getLogger(__name__)
+if not logger.handlers:
+    _log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    logger.addHandler(logging.handlers.QueueHandler(_log_queue))
+    logger.setLevel(logging.INFO)
+    _log_listener = logging.handlers.QueueListener(
+        _log_queue, logging.StreamHandler()
+    )
+    _log_listener.start()
+
+# Module-level cache of authenticated service objects keyed by
+# (credentials_file, token_file). The web app, chatbot and calendar service
+# each build a CalendarHandler; sharing the service means the OAuth flow,
+# token refresh and discovery document fetch happen once per process.
+_service_cache: Dict[Tuple[str, str], Any] = {}
+
+# Process-wide credentials keyed the same way, so token.json is read and
+# parsed once per process rather than per handler. The lock ensures only
+# one thread runs a refresh or OAuth flow at a time.
+_credentials_cache: Dict[Tuple[str, str], Credentials] = {}
+_credentials_lock = threading.Lock()
+
+# Refresh the access token this many seconds before it expires, so no
+# request (or batch in flight) ever eats a 401 + refresh + retry stall
+TOKEN_REFRESH_LEEWAY_SECONDS = 60
+
+# Google caps calendar batch requests at 50 sub-requests each
+BATCH_REQUEST_LIMIT = 50
+
+# freebusy.query accepts at most 50 calendars per call; larger lookups
+# are split into chunks and dispatched concurrently. The worker bound
+# keeps aggregate QPS well inside the per-user quota.
+FREEBUSY_QUERY_LIMIT = 50
+FREEBUSY_MAX_WORKERS = 8
+
+# Worker bound for the per-calendar fallback when a batched event fetch
+# fails; like the freebusy fan-out, sized to stay inside per-user quota
+FETCH_FALLBACK_MAX_WORKERS = 8
+
+# Coalescing window for bursty availability checks: calls arriving
+# within this window fuse into one freebusy query, flushed early once
+# the batch cap is hit
+COALESCE_WINDOW_SECONDS = 0.05
+COALESCE_MAX_BATCH = 64
+
+# Partial-response mask for events.list: just the fields the display and
+# availability paths read, dropping attendees, extendedProperties,
+# htmlLink and the rest of the payload (a 5-10x size cut on busy
+# calendars)
+EVENT_LIST_FIELDS = 'items(id,summary,description,location,start,end),nextPageToken'
+
+class _OrjsonModel(JsonModel):
+    """Discovery request/response model backed by orjson.
+
+    Response decoding dominates CPU when listing many events; orjson
+    parses straight from the response bytes with no Python-level
+    tokenization, and dumps builds request bodies without the
+    intermediate str pass. Plugged in via build(..., model=...), the
+    client library's supported serialization seam.
+    """
+
+    def serialize(self, body_value):
+        if (isinstance(body_value, dict) and 'data' not in body_value
+                and self._data_wrapper):
+            body_value = {'data': body_value}
+        return orjson.dumps(body_value).decode()
+
+    def deserialize(self, content):
+        body = orjson.loads(content)
+        if self._data_wrapper and 'data' in body:
+            body = body['data']
+        return body
+
+class PlanRef:
+    """Reference to a field of an earlier execute_plan call's response.
+
+    Lets a later call consume an earlier one's output, e.g.
+    PlanRef(0, 'id') as an event_id pulls the ID of the event created by
+    call 0 once its layer has executed.
+    """
+
+    def __init__(self, call_index: int, field: str = 'id'):
+        self.call_index = call_index
+        self.field = field
+
+@lru_cache(maxsize=1024)
+def _iso_to_ts(value: str) -> float:
+    """Epoch seconds for an ISO timestamp, memoized.
+
+    The same busy intervals recur across availability calls within a cache
+    window, so repeats skip the parse entirely; epoch floats also make the
+    overlap tests plain numeric compares instead of datetime comparisons.
+    ciso8601 parses in C, so even cold lookups skip the stdlib path.
+    """
+    return ciso8601.parse_datetime(value).timestamp()
+
+# Transient failures worth retrying: rate limiting and server errors,
+# backed off per Google's recommended exponential schedule
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+RETRY_MAX_ATTEMPTS = 5
+RETRY_BASE_SECONDS = 0.5
+RETRY_CAP_SECONDS = 32.0
+
+def _execute_with_retry(request, **kwargs):
+    """Execute an API request, retrying transient failures with backoff.
+
+    429/5xx responses retry with exponential backoff plus jitter,
+    honoring a Retry-After header when the server sends one; anything
+    else (or the final attempt) re-raises for the caller's normal error
+    handling. Retries reuse the request's warm connection, so they skip
+    the TLS handshake.
+    """
+    for attempt in range(RETRY_MAX_ATTEMPTS):
+        try:
+            return request.execute(**kwargs)
+        except HttpError as error:
+            status = getattr(error.resp, 'status', None)
+            if status not in RETRYABLE_STATUS_CODES or attempt == RETRY_MAX_ATTEMPTS - 1:
+                raise
+            retry_after = error.resp.get('retry-after')
+            try:
+                delay = float(retry_after)
+            except (TypeError, ValueError):
+                delay = min(RETRY_CAP_SECONDS, RETRY_BASE_SECONDS * 2 ** attempt)
+                delay += random.random() * 0.1
+            logger.info(f"Retrying after HTTP {status} in {delay:.1f}s "
+                        f"(attempt {attempt + 1}/{RETRY_MAX_ATTEMPTS})")
+            time.sleep(delay)
 
 class CalendarHandler:
     """
@@ -57,87 +208,173 @@ class CalendarHandler:
         self.credentials_file = os.path.join(server_root, 'config', credentials_file)
         self.token_file = os.path.join(server_root, 'config', token_file)
         
-        # Service instance
+        # Service instance and its bound collections (set by authenticate)
         self.service = None
-        
+        self.events = None
+        self.calendars = None
+        self.freebusy = None
+
         # Default calendar ID
         self.default_calendar_id = DEFAULT_CALENDAR_ID
         
         # Default timezone
         self.timezone = 'UTC'
-    
-    def authenticate(self) -> bool:
-        """
-        Authenticate with Google Calendar API using OAuth 2.0
-        
-        Returns:
-            bool: True if authentication successful, False otherwise
+
+        # Short-TTL cache of events.list results keyed by
+        # (calendar_id, start minute, end minute, max_results).
+        # Availability and display queries repeat the same window within
+        # seconds; the minute bucket keeps a moving "now" timestamp from
+        # splitting keys while still separating distinct intra-day
+        # windows. Mutations clear it so reads never serve stale events.
+        self._events_cache = TTLCache(EVENTS_CACHE_TTL_SECONDS)
+
+        # Pending coalesced availability checks and the scheduled flush
+        # (see check_availability_coalesced)
+        self._pending_checks = []
+        self._flush_handle = None
+
+    @staticmethod
+    def _expiring_soon(creds: Credentials) -> bool:
+        """Whether the access token is invalid or inside the refresh leeway"""
+        if not creds.valid:
+            return True
+        if creds.expiry is None:
+            return False
+        return (creds.expiry - datetime.utcnow()).total_seconds() < TOKEN_REFRESH_LEEWAY_SECONDS
+
+    def _load_credentials(self, creds: Optional[Credentials]) -> Optional[Credentials]:
+        """Load, refresh or interactively obtain credentials.
+
+        Runs under _credentials_lock. Tokens are refreshed proactively
+        while still valid (see TOKEN_REFRESH_LEEWAY_SECONDS), and
+        token.json is only rewritten when the access token actually
+        changed, so routine reuse does no disk writes.
         """
-        print("Starting Google Calendar API authentication...")
-        
-        creds = None
-        
-        # Check if we have a saved token
-        if os.path.exists(self.token_file):
-            print("Found existing token file, attempting to use...")
+        # Read the saved token only when no cached credentials exist yet
+        if creds is None and os.path.exists(self.token_file):
+            logger.info("Found existing token file, attempting to use...")
             try:
                 creds = Credentials.from_authorized_user_file(self.token_file, self.SCOPES)
-                print("Loaded existing credentials")
+                logger.info("Loaded existing credentials")
             except Exception as e:
-                print(f"Error loading token: {e}")
+                logger.error(f"Error loading token: {e}")
                 creds = None
-        
-        # If no valid credentials, authenticate
-        if not creds or not creds.valid:
-            if creds and creds.expired and creds.refresh_token:
-                print("Refreshing expired token...")
+
+        saved_token = creds.token if creds else None
+
+        # Refresh before expiry instead of waiting for a 401
+        if creds and self._expiring_soon(creds):
+            if creds.refresh_token:
+                logger.info("Refreshing token...")
                 try:
                     creds.refresh(Request())
-                    print("Token refreshed successfully")
+                    logger.info("Token refreshed successfully")
                 except Exception as e:
-                    print(f"Failed to refresh token: {e}")
+                    logger.error(f"Failed to refresh token: {e}")
                     creds = None
-            
-            # If still no valid credentials, start OAuth flow
-            if not creds:
-                if not os.path.exists(self.credentials_file):
-                    print(f"Credentials file '{self.credentials_file}' not found!")
-                    print("\nSetup Instructions:")
-                    print("1. Go to https://console.cloud.google.com/")
-                    print("2. Create a project or select existing one")
-                    print("3. Enable Google Calendar API")
-                    print("4. Create OAuth 2.0 credentials (Desktop application)")
-                    print("5. Download credentials.json and place it in this directory")
-                    return False
-                
-                print("Starting OAuth 2.0 authentication flow...")
-                try:
-                    flow = InstalledAppFlow.from_client_secrets_file(
-                        self.credentials_file, 
-                        self.SCOPES
-                    )
-                    creds = flow.run_local_server(port=0)
-                    print("OAuth authentication successful!")
-                except Exception as e:
-                    print(f"OAuth authentication failed: {e}")
-                    return False
-            
-            # Save the credentials for next time
+            else:
+                creds = None
+
+        # If still no valid credentials, start OAuth flow
+        if not creds or not creds.valid:
+            if not os.path.exists(self.credentials_file):
+                logger.error(
+                    f"Credentials file '{self.credentials_file}' not found!\n"
+                    "Setup Instructions:\n"
+                    "1. Go to https://console.cloud.google.com/\n"
+                    "2. Create a project or select existing one\n"
+                    "3. Enable Google Calendar API\n"
+                    "4. Create OAuth 2.0 credentials (Desktop application)\n"
+                    "5. Download credentials.json and place it in this directory"
+                )
+                return None
+
+            logger.info("Starting OAuth 2.0 authentication flow...")
+            try:
+                flow = InstalledAppFlow.from_client_secrets_file(
+                    self.credentials_file,
+                    self.SCOPES
+                )
+                creds = flow.run_local_server(port=0)
+                logger.info("OAuth authentication successful!")
+            except Exception as e:
+                logger.error(f"OAuth authentication failed: {e}")
+                return None
+
+        # Save the credentials only when the token changed
+        if creds.token != saved_token:
             try:
                 with open(self.token_file, 'w') as token:
                     token.write(creds.to_json())
-                print("Credentials saved to token.json")
+                logger.info("Credentials saved to token.json")
             except Exception as e:
-                print(f"Could not save credentials: {e}")
-        
-        # Build the service
+                logger.error(f"Could not save credentials: {e}")
+
+        return creds
+
+    def authenticate(self) -> bool:
+        """
+        Authenticate with Google Calendar API using OAuth 2.0
+
+        Returns:
+            bool: True if authentication successful, False otherwise
+        """
+        # Fast path: another handler already authenticated and the shared
+        # token is comfortably inside its lifetime
+        cache_key = (self.credentials_file, self.token_file)
+        cached_service = _service_cache.get(cache_key)
+        creds = _credentials_cache.get(cache_key)
+        if cached_service is not None and creds is not None and not self._expiring_soon(creds):
+            self.service = cached_service
+            self._bind_collections()
+            return True
+
+        with _credentials_lock:
+            # Re-check under the lock; a concurrent caller may have just
+            # finished the refresh or OAuth flow
+            creds = _credentials_cache.get(cache_key)
+            if creds is None or self._expiring_soon(creds):
+                if creds is None:
+                    logger.info("Starting Google Calendar API authentication...")
+                creds = self._load_credentials(creds)
+            if creds is None:
+                return False
+            _credentials_cache[cache_key] = creds
+
+        # refresh() mutates the Credentials in place, so a service built
+        # earlier around these credentials stays valid after a refresh
+        cached_service = _service_cache.get(cache_key)
+        if cached_service is not None:
+            self.service = cached_service
+            self._bind_collections()
+            return True
+
+        # Build the service over one authorized keep-alive connection, so
+        # TLS handshakes and TCP slow-start amortize across every API call
+        # instead of being paid per request
         try:
-            self.service = build('calendar', 'v3', credentials=creds)
-            print("Google Calendar API service created successfully!")
+            authorized_http = google_auth_httplib2.AuthorizedHttp(creds, http=httplib2.Http())
+            self.service = build('calendar', 'v3', http=authorized_http,
+                                 model=_OrjsonModel())
+            _service_cache[cache_key] = self.service
+            self._bind_collections()
+            logger.info("Google Calendar API service created successfully!")
             return True
         except Exception as e:
-            print(f"Failed to create service: {e}")
+            logger.error(f"Failed to create service: {e}")
             return False
+
+    def _bind_collections(self):
+        """Bind the discovery collections once per authenticate.
+
+        events()/calendarList()/freebusy() rebuild the collection object on
+        every access via __getattr__; binding them here turns each API call
+        site into a plain attribute lookup (and gives tests one obvious
+        seam to stub).
+        """
+        self.events = self.service.events()
+        self.calendars = self.service.calendarList()
+        self.freebusy = self.service.freebusy()
     
     def get_calendars(self) -> List[Dict]:
         """
@@ -147,11 +384,11 @@ class CalendarHandler:
             List of calendar dictionaries
         """
         if not self.service:
-            print("No service available. Please authenticate first.")
+            logger.error("No service available. Please authenticate first.")
             return []
         
         try:
-            calendar_list = self.service.calendarList().list().execute()
+            calendar_list = _execute_with_retry(self.calendars.list())
             calendars = calendar_list.get('items', [])
             
             calendar_data = []
@@ -170,7 +407,7 @@ class CalendarHandler:
             return calendar_data
             
         except HttpError as error:
-            print(f"Error fetching calendars: {error}")
+            logger.error(f"Error fetching calendars: {error}")
             return []
     
     def set_default_calendar(self, calendar_id: str) -> bool:
@@ -188,13 +425,119 @@ class CalendarHandler:
         
         if calendar_id in calendar_ids:
             self.default_calendar_id = calendar_id
-            print(f"Default calendar set to: {calendar_id}")
+            logger.info(f"Default calendar set to: {calendar_id}")
             return True
         else:
-            print(f"Calendar ID '{calendar_id}' not found in accessible calendars")
+            logger.error(f"Calendar ID '{calendar_id}' not found in accessible calendars")
             return False
     
-    def add_event(self, 
+    def _build_event_body(self,
+                          title: str,
+                          start_time: str,
+                          duration_minutes: int = 60,
+                          description: str = "",
+                          location: str = "",
+                          attendees: List[str] = None,
+                          all_day: bool = False,
+                          reminders: Dict = None) -> Dict:
+        """Build the event resource body for an insert"""
+        start_dt = datetime.fromisoformat(start_time.replace('Z', '+00:00'))
+
+        if all_day:
+            end_dt = start_dt + timedelta(days=1)
+            start_event = {'date': start_dt.date().isoformat()}
+            end_event = {'date': end_dt.date().isoformat()}
+        else:
+            end_dt = start_dt + timedelta(minutes=duration_minutes)
+            start_event = {'dateTime': start_dt.isoformat(), 'timeZone': self.timezone}
+            end_event = {'dateTime': end_dt.isoformat(), 'timeZone': self.timezone}
+
+        event = {
+            'summary': title,
+            'description': description,
+            'location': location,
+            'start': start_event,
+            'end': end_event
+        }
+
+        if attendees:
+            event['attendees'] = [{'email': email} for email in attendees]
+
+        if reminders:
+            event['reminders'] = reminders
+        else:
+            # Default reminders
+            event['reminders'] = {
+                'useDefault': False,
+                'overrides': [
+                    {'method': 'email', 'minutes': 24 * 60},  # 1 day before
+                    {'method': 'popup', 'minutes': 10}        # 10 minutes before
+                ]
+            }
+
+        return event
+
+    def compile_event_template(self,
+                               duration_minutes: int = 60,
+                               description: str = "",
+                               location: str = "",
+                               attendees: List[str] = None,
+                               all_day: bool = False,
+                               reminders: Dict = None):
+        """
+        Compile a reusable event-body builder for one configuration
+
+        Bulk publishers create many events sharing everything but title
+        and start time. The returned closure captures the shared fields
+        once — reminders resolved, attendee dicts built, timezone bound —
+        so each call does only the timestamp arithmetic and a flat dict
+        copy instead of re-running _build_event_body's branches.
+
+        Args:
+            Same shared fields as add_event minus title/start_time
+
+        Returns:
+            Callable (title, start_time, duration_minutes=...) -> event
+            body dict, suitable for add_event_bodies or execute_plan
+        """
+        shared = {
+            'description': description,
+            'location': location,
+            'reminders': reminders or {
+                'useDefault': False,
+                'overrides': [
+                    {'method': 'email', 'minutes': 24 * 60},  # 1 day before
+                    {'method': 'popup', 'minutes': 10}        # 10 minutes before
+                ]
+            }
+        }
+        if attendees:
+            shared['attendees'] = [{'email': email} for email in attendees]
+
+        timezone = self.timezone
+        default_duration = duration_minutes
+
+        if all_day:
+            def make_event_body(title, start_time, duration_minutes=default_duration):
+                start_dt = datetime.fromisoformat(start_time.replace('Z', '+00:00'))
+                body = dict(shared)
+                body['summary'] = title
+                body['start'] = {'date': start_dt.date().isoformat()}
+                body['end'] = {'date': (start_dt + timedelta(days=1)).date().isoformat()}
+                return body
+        else:
+            def make_event_body(title, start_time, duration_minutes=default_duration):
+                start_dt = datetime.fromisoformat(start_time.replace('Z', '+00:00'))
+                end_dt = start_dt + timedelta(minutes=duration_minutes)
+                body = dict(shared)
+                body['summary'] = title
+                body['start'] = {'dateTime': start_dt.isoformat(), 'timeZone': timezone}
+                body['end'] = {'dateTime': end_dt.isoformat(), 'timeZone': timezone}
+                return body
+
+        return make_event_body
+
+    def add_event(self,
                   title: str,
                   start_time: str,
                   duration_minutes: int = 60,
@@ -222,7 +565,7 @@ class CalendarHandler:
             str: Event ID if successful, None otherwise
         """
         if not self.service:
-            print("No service available. Please authenticate first.")
+            logger.error("No service available. Please authenticate first.")
             return None
         
         # Use default calendar if none specified
@@ -230,61 +573,35 @@ class CalendarHandler:
             calendar_id = self.default_calendar_id
         
         try:
-            # Parse start time
-            start_dt = datetime.fromisoformat(start_time.replace('Z', '+00:00'))
-            
-            # Calculate end time
-            if all_day:
-                end_dt = start_dt + timedelta(days=1)
-                start_event = {'date': start_dt.date().isoformat()}
-                end_event = {'date': end_dt.date().isoformat()}
-            else:
-                end_dt = start_dt + timedelta(minutes=duration_minutes)
-                start_event = {'dateTime': start_dt.isoformat(), 'timeZone': self.timezone}
-                end_event = {'dateTime': end_dt.isoformat(), 'timeZone': self.timezone}
-            
             # Build event object
-            event = {
-                'summary': title,
-                'description': description,
-                'location': location,
-                'start': start_event,
-                'end': end_event
-            }
-            
-            # Add attendees if provided
-            if attendees:
-                event['attendees'] = [{'email': email} for email in attendees]
-            
-            # Add reminders if provided
-            if reminders:
-                event['reminders'] = reminders
-            else:
-                # Default reminders
-                event['reminders'] = {
-                    'useDefault': False,
-                    'overrides': [
-                        {'method': 'email', 'minutes': 24 * 60},  # 1 day before
-                        {'method': 'popup', 'minutes': 10}        # 10 minutes before
-                    ]
-                }
-            
+            event = self._build_event_body(
+                title=title,
+                start_time=start_time,
+                duration_minutes=duration_minutes,
+                description=description,
+                location=location,
+                attendees=attendees,
+                all_day=all_day,
+                reminders=reminders
+            )
+
             # Insert the event
-            event_result = self.service.events().insert(
+            event_result = _execute_with_retry(self.events.insert(
                 calendarId=calendar_id,
                 body=event,
                 sendUpdates='all' if attendees else 'none'
-            ).execute()
+            ))
             
             event_id = event_result.get('id')
-            print(f"Event '{title}' created successfully with ID: {event_id}")
+            self._events_cache.clear()
+            logger.debug(f"Event '{title}' created successfully with ID: {event_id}")
             return event_id
             
         except HttpError as error:
-            print(f"Error creating event: {error}")
+            logger.error(f"Error creating event: {error}")
             return None
         except Exception as e:
-            print(f"Error creating event: {e}")
+            logger.error(f"Error creating event: {e}")
             return None
     
     def delete_event(self, event_id: str, calendar_id: str = None) -> bool:
@@ -299,7 +616,7 @@ class CalendarHandler:
             bool: True if successful, False otherwise
         """
         if not self.service:
-            print("No service available. Please authenticate first.")
+            logger.error("No service available. Please authenticate first.")
             return False
         
         # Use default calendar if none specified
@@ -307,20 +624,250 @@ class CalendarHandler:
             calendar_id = self.default_calendar_id
         
         try:
-            self.service.events().delete(
+            _execute_with_retry(self.events.delete(
                 calendarId=calendar_id,
                 eventId=event_id,
                 sendUpdates='all'
-            ).execute()
-            
-            print(f"Event {event_id} deleted successfully")
+            ))
+
+            self._events_cache.clear()
+            logger.debug(f"Event {event_id} deleted successfully")
             return True
             
         except HttpError as error:
-            print(f"Error deleting event: {error}")
+            logger.error(f"Error deleting event: {error}")
             return False
     
-    def update_event(self, 
+    def add_events_batch(self,
+                         events: List[Dict],
+                         calendar_id: str = None) -> List[Optional[str]]:
+        """
+        Insert several events with batched HTTP requests
+
+        Packs up to 50 inserts (Google's batch cap) into one multipart
+        request, collapsing N round-trips into ceil(N/50).
+
+        Args:
+            events: List of dicts accepting the same fields as add_event
+                    (title, start_time, duration_minutes, ...)
+            calendar_id: Calendar ID (uses default if None)
+
+        Returns:
+            List of event IDs in input order, None where an insert failed
+        """
+        return self.add_event_bodies(
+            [self._build_event_body(**event) for event in events],
+            calendar_id
+        )
+
+    def add_event_bodies(self,
+                         bodies: List[Dict],
+                         calendar_id: str = None) -> List[Optional[str]]:
+        """
+        Insert prebuilt event resource bodies with batched HTTP requests
+
+        Pairs with compile_event_template: a bulk publisher compiles its
+        template once, maps it over the rows, and hands the bodies here
+        without re-running the per-event body construction.
+
+        Args:
+            bodies: Event resource dicts as the API expects them
+            calendar_id: Calendar ID (uses default if None)
+
+        Returns:
+            List of event IDs in input order, None where an insert failed
+        """
+        if not self.service:
+            logger.error("No service available. Please authenticate first.")
+            return []
+
+        # Use default calendar if none specified
+        if calendar_id is None:
+            calendar_id = self.default_calendar_id
+
+        results: List[Optional[str]] = [None] * len(bodies)
+
+        def _collect(request_id, response, exception):
+            if exception is not None:
+                logger.error(f"Error creating event {request_id}: {exception}")
+            else:
+                results[int(request_id)] = response.get('id')
+
+        try:
+            for chunk_start in range(0, len(bodies), BATCH_REQUEST_LIMIT):
+                batch = self.service.new_batch_http_request(callback=_collect)
+                for i in range(chunk_start, min(chunk_start + BATCH_REQUEST_LIMIT, len(bodies))):
+                    batch.add(
+                        self.events.insert(
+                            calendarId=calendar_id,
+                            body=bodies[i],
+                            sendUpdates='none'
+                        ),
+                        request_id=str(i)
+                    )
+                _execute_with_retry(batch)
+        except HttpError as error:
+            logger.error(f"Error executing batch event insert: {error}")
+
+        self._events_cache.clear()
+        return results
+
+    def delete_events_batch(self,
+                            event_ids: List[str],
+                            calendar_id: str = None) -> Dict[str, bool]:
+        """
+        Delete several events with batched HTTP requests
+
+        Args:
+            event_ids: IDs of the events to delete
+            calendar_id: Calendar ID (uses default if None)
+
+        Returns:
+            Dict mapping event ID to whether its delete succeeded
+        """
+        if not self.service:
+            logger.error("No service available. Please authenticate first.")
+            return {}
+
+        # Use default calendar if none specified
+        if calendar_id is None:
+            calendar_id = self.default_calendar_id
+
+        results = {event_id: False for event_id in event_ids}
+
+        def _collect(request_id, response, exception):
+            if exception is not None:
+                logger.error(f"Error deleting event {request_id}: {exception}")
+            else:
+                results[request_id] = True
+
+        try:
+            for chunk_start in range(0, len(event_ids), BATCH_REQUEST_LIMIT):
+                batch = self.service.new_batch_http_request(callback=_collect)
+                for event_id in event_ids[chunk_start:chunk_start + BATCH_REQUEST_LIMIT]:
+                    batch.add(
+                        self.events.delete(
+                            calendarId=calendar_id,
+                            eventId=event_id,
+                            sendUpdates='none'
+                        ),
+                        request_id=event_id
+                    )
+                _execute_with_retry(batch)
+        except HttpError as error:
+            logger.error(f"Error executing batch event delete: {error}")
+
+        self._events_cache.clear()
+        return results
+
+    @staticmethod
+    def _resolve_ref(value, results):
+        """Substitute a PlanRef with the referenced call's response field"""
+        if isinstance(value, PlanRef):
+            result = results[value.call_index]
+            if isinstance(result, dict):
+                return result.get(value.field)
+            return result
+        return value
+
+    def _plan_request(self, call: Dict, results: List[Any]):
+        """Build the HttpRequest for one execute_plan call"""
+        kwargs = {
+            key: self._resolve_ref(value, results)
+            for key, value in call.get('kwargs', {}).items()
+        }
+        calendar_id = kwargs.pop('calendar_id', None) or self.default_calendar_id
+        method = call['method']
+
+        if method == 'add_event':
+            return self.events.insert(
+                calendarId=calendar_id,
+                body=self._build_event_body(**kwargs),
+                sendUpdates='none'
+            )
+        if method == 'get_event':
+            return self.events.get(
+                calendarId=calendar_id,
+                eventId=kwargs['event_id']
+            )
+        if method == 'patch_event':
+            return self.events.patch(
+                calendarId=calendar_id,
+                eventId=kwargs.pop('event_id'),
+                body=kwargs,
+                sendUpdates='none'
+            )
+        if method == 'delete_event':
+            return self.events.delete(
+                calendarId=calendar_id,
+                eventId=kwargs['event_id'],
+                sendUpdates='none'
+            )
+
+        logger.error(f"Unknown plan method: {call['method']}")
+        return None
+
+    def execute_plan(self, calls: List[Dict]) -> List[Any]:
+        """
+        Execute a dependent multi-step workflow with one batch per layer
+
+        Each call is a dict:
+            {'method': 'add_event' | 'get_event' | 'patch_event' | 'delete_event',
+             'kwargs': {...},
+             'depends_on': [indices of earlier calls]}
+
+        add_event kwargs match _build_event_body; patch_event kwargs are
+        API event fields plus event_id. A kwarg may be a PlanRef to feed
+        an earlier call's output into a later one (create then update).
+
+        Calls are layered topologically: each call runs one layer after
+        its deepest dependency, independent calls share a layer, and each
+        layer goes out as a single multipart batch — N dependent calls
+        cost one round-trip per layer instead of one per call.
+
+        Args:
+            calls: Plan calls as described above, depends_on referring
+                   only to earlier indices
+
+        Returns:
+            List of raw API responses in call order, None where a call
+            failed or was skipped
+        """
+        if not self.service:
+            logger.error("No service available. Please authenticate first.")
+            return []
+
+        # Layer each call one past its deepest dependency
+        layers: Dict[int, List[int]] = {}
+        depth = [0] * len(calls)
+        for i, call in enumerate(calls):
+            deps = call.get('depends_on', [])
+            depth[i] = 1 + max((depth[d] for d in deps), default=-1)
+            layers.setdefault(depth[i], []).append(i)
+
+        results: List[Any] = [None] * len(calls)
+
+        def _collect(request_id, response, exception):
+            if exception is not None:
+                logger.error(f"Error in plan call {request_id}: {exception}")
+            else:
+                results[int(request_id)] = response
+
+        try:
+            for layer in sorted(layers):
+                batch = self.service.new_batch_http_request(callback=_collect)
+                for i in layers[layer]:
+                    request = self._plan_request(calls[i], results)
+                    if request is not None:
+                        batch.add(request, request_id=str(i))
+                _execute_with_retry(batch)
+        except HttpError as error:
+            logger.error(f"Error executing plan batch: {error}")
+
+        self._events_cache.clear()
+        return results
+
+    def update_event(self,
                     event_id: str,
                     title: str = None,
                     start_time: str = None,
@@ -346,7 +893,7 @@ class CalendarHandler:
             bool: True if successful, False otherwise
         """
         if not self.service:
-            print("No service available. Please authenticate first.")
+            logger.error("No service available. Please authenticate first.")
             return False
         
         # Use default calendar if none specified
@@ -355,10 +902,10 @@ class CalendarHandler:
         
         try:
             # Get existing event
-            event = self.service.events().get(
+            event = _execute_with_retry(self.events.get(
                 calendarId=calendar_id,
                 eventId=event_id
-            ).execute()
+            ))
             
             # Update fields if provided
             if title:
@@ -377,18 +924,19 @@ class CalendarHandler:
                 event['attendees'] = [{'email': email} for email in attendees]
             
             # Update the event
-            updated_event = self.service.events().update(
+            updated_event = _execute_with_retry(self.events.update(
                 calendarId=calendar_id,
                 eventId=event_id,
                 body=event,
                 sendUpdates='all'
-            ).execute()
-            
-            print(f"Event {event_id} updated successfully")
+            ))
+
+            self._events_cache.clear()
+            logger.debug(f"Event {event_id} updated successfully")
             return True
             
         except HttpError as error:
-            print(f"Error updating event: {error}")
+            logger.error(f"Error updating event: {error}")
             return False
     
     def get_event(self, event_id: str, calendar_id: str = None) -> Optional[Dict]:
@@ -403,7 +951,7 @@ class CalendarHandler:
             Dict: Event data if found, None otherwise
         """
         if not self.service:
-            print("No service available. Please authenticate first.")
+            logger.error("No service available. Please authenticate first.")
             return None
         
         # Use default calendar if none specified
@@ -411,66 +959,211 @@ class CalendarHandler:
             calendar_id = self.default_calendar_id
         
         try:
-            event = self.service.events().get(
+            event = _execute_with_retry(self.events.get(
                 calendarId=calendar_id,
                 eventId=event_id
-            ).execute()
+            ))
             
             return event
             
         except HttpError as error:
-            print(f"Error retrieving event: {error}")
+            logger.error(f"Error retrieving event: {error}")
             return None
     
-    def get_events(self, 
+    def iter_events(self,
+                    start_time: str = None,
+                    end_time: str = None,
+                    calendar_id: str = None,
+                    page_size: int = 50,
+                    fields: str = EVENT_LIST_FIELDS):
+        """
+        Yield events from a calendar, paging transparently
+
+        Follows nextPageToken so callers see one flat stream however many
+        pages the window spans, and asks for a partial response so each
+        page carries only the fields the callers actually read.
+
+        Args:
+            start_time: Start time in ISO format (defaults to now)
+            end_time: End time in ISO format (defaults to 7 days from now)
+            calendar_id: Calendar ID (uses default if None)
+            page_size: Events fetched per request
+            fields: Partial-response mask for each page
+
+        Yields:
+            Event dictionaries in start-time order
+        """
+        if not self.service:
+            logger.error("No service available. Please authenticate first.")
+            return
+
+        # Use default calendar if none specified
+        if calendar_id is None:
+            calendar_id = self.default_calendar_id
+
+        # Set default time range if not provided
+        if start_time is None:
+            start_time = datetime.now(pytz.UTC).isoformat()
+        if end_time is None:
+            end_time = (datetime.now(pytz.UTC) + timedelta(days=7)).isoformat()
+
+        page_token = None
+        while True:
+            try:
+                events_result = _execute_with_retry(self.events.list(
+                    calendarId=calendar_id,
+                    timeMin=start_time,
+                    timeMax=end_time,
+                    maxResults=page_size,
+                    singleEvents=True,
+                    orderBy='startTime',
+                    pageToken=page_token,
+                    fields=fields
+                ))
+            except HttpError as error:
+                logger.error(f"Error fetching events: {error}")
+                return
+
+            yield from events_result.get('items', [])
+
+            page_token = events_result.get('nextPageToken')
+            if not page_token:
+                return
+
+    def get_events(self,
                    start_time: str = None,
                    end_time: str = None,
                    calendar_id: str = None,
                    max_results: int = 50) -> List[Dict]:
         """
         Get events from a calendar within a time range
-        
+
         Args:
             start_time: Start time in ISO format (defaults to now)
             end_time: End time in ISO format (defaults to 7 days from now)
             calendar_id: Calendar ID (uses default if None)
             max_results: Maximum number of events to return
-            
+
         Returns:
             List of event dictionaries
         """
         if not self.service:
-            print("No service available. Please authenticate first.")
+            logger.error("No service available. Please authenticate first.")
             return []
-        
+
         # Use default calendar if none specified
         if calendar_id is None:
             calendar_id = self.default_calendar_id
-        
+
+        # Set default time range if not provided
+        if start_time is None:
+            start_time = datetime.now(pytz.UTC).isoformat()
+        if end_time is None:
+            end_time = (datetime.now(pytz.UTC) + timedelta(days=7)).isoformat()
+
+        # Minute-bucketed bounds, like the freebusy key below: day
+        # truncation made different intra-day windows on the same date
+        # collide (a "now"-adjusted display fetch vs a full-day bulk
+        # delete fetch), serving one window's events for the other
+        cache_key = (calendar_id, start_time[:16], end_time[:16], max_results)
+        cached = self._events_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        events = list(islice(
+            self.iter_events(start_time=start_time, end_time=end_time,
+                             calendar_id=calendar_id,
+                             page_size=min(max_results, 50)),
+            max_results
+        ))
+        self._events_cache.set(cache_key, events)
+        return events
+    
+    def get_events_batch(self,
+                         calendar_ids: List[str],
+                         start_time: str = None,
+                         end_time: str = None,
+                         max_results: int = 50) -> Dict[str, List[Dict]]:
+        """
+        Get events from several calendars with one batched HTTP request
+
+        Args:
+            calendar_ids: List of calendar IDs to fetch
+            start_time: Start time in ISO format (defaults to now)
+            end_time: End time in ISO format (defaults to 7 days from now)
+            max_results: Maximum number of events per calendar
+
+        Returns:
+            Dict mapping calendar ID to its list of events
+        """
+        if not self.service:
+            logger.error("No service available. Please authenticate first.")
+            return {}
+
+        # Set default time range if not provided
+        if start_time is None:
+            start_time = datetime.now(pytz.UTC).isoformat()
+        if end_time is None:
+            end_time = (datetime.now(pytz.UTC) + timedelta(days=7)).isoformat()
+
+        results = {cal_id: [] for cal_id in calendar_ids}
+
+        def _collect(request_id, response, exception):
+            if exception is not None:
+                logger.error(f"Error fetching events for calendar {request_id}: {exception}")
+            else:
+                results[request_id] = response.get('items', [])
+
         try:
-            # Set default time range if not provided
-            if start_time is None:
-                start_time = datetime.now(pytz.UTC).isoformat()
-            if end_time is None:
-                end_time = (datetime.now(pytz.UTC) + timedelta(days=7)).isoformat()
-            
-            events_result = self.service.events().list(
-                calendarId=calendar_id,
-                timeMin=start_time,
-                timeMax=end_time,
-                maxResults=max_results,
-                singleEvents=True,
-                orderBy='startTime'
-            ).execute()
-            
-            events = events_result.get('items', [])
-            return events
-            
+            batch = self.service.new_batch_http_request(callback=_collect)
+            for cal_id in calendar_ids:
+                batch.add(
+                    self.events.list(
+                        calendarId=cal_id,
+                        timeMin=start_time,
+                        timeMax=end_time,
+                        maxResults=max_results,
+                        singleEvents=True,
+                        orderBy='startTime'
+                    ),
+                    request_id=cal_id
+                )
+            _execute_with_retry(batch)
+            return results
+
         except HttpError as error:
-            print(f"Error fetching events: {error}")
-            return []
-    
-    def check_availability(self, 
+            # The batch endpoint itself failed (not an individual
+            # sub-request); the per-calendar calls may still work, so fan
+            # them out across worker threads rather than serializing N
+            # round-trips. httplib2 connections aren't thread-safe, so
+            # each worker executes on its own authorized connection.
+            logger.error(f"Error executing batch event fetch: {error}")
+            logger.info("Falling back to parallel per-calendar event fetches")
+
+            def _fetch(cal_id):
+                try:
+                    response = _execute_with_retry(
+                        self.events.list(
+                            calendarId=cal_id,
+                            timeMin=start_time,
+                            timeMax=end_time,
+                            maxResults=max_results,
+                            singleEvents=True,
+                            orderBy='startTime'
+                        ),
+                        http=self._fresh_http()
+                    )
+                    return cal_id, response.get('items', [])
+                except HttpError as err:
+                    logger.error(f"Error fetching events for calendar {cal_id}: {err}")
+                    return cal_id, []
+
+            with ThreadPoolExecutor(max_workers=FETCH_FALLBACK_MAX_WORKERS) as executor:
+                for cal_id, items in executor.map(_fetch, calendar_ids):
+                    results[cal_id] = items
+            return results
+
+    def check_availability(self,
                           start_time: str,
                           end_time: str,
                           calendar_id: str = None) -> Tuple[bool, List[Dict]]:
@@ -486,7 +1179,7 @@ class CalendarHandler:
             Tuple[bool, List[Dict]]: (is_available, conflicting_events)
         """
         if not self.service:
-            print("No service available. Please authenticate first.")
+            logger.error("No service available. Please authenticate first.")
             return False, []
         
         # Use default calendar if none specified
@@ -494,37 +1187,36 @@ class CalendarHandler:
             calendar_id = self.default_calendar_id
         
         try:
-            # Get events in the time range
-            events = self.get_events(start_time, end_time, calendar_id)
-            
+            # Ask freebusy for busy intervals only, instead of pulling full
+            # event payloads through events.list just to overlap-test them
+            free_busy = self.get_free_busy(start_time, end_time, [calendar_id])
+            busy_ranges = free_busy.get('calendars', {}).get(calendar_id, {}).get('busy', [])
+
+            # Epoch compares: the requested window parses once and each
+            # busy interval costs two memoized C parses, not four
+            # datetime constructions per interval
+            requested_start_ts = _iso_to_ts(start_time)
+            requested_end_ts = _iso_to_ts(end_time)
+
             # Check for conflicts
             conflicting_events = []
-            for event in events:
-                event_start = event.get('start', {}).get('dateTime') or event.get('start', {}).get('date')
-                event_end = event.get('end', {}).get('dateTime') or event.get('end', {}).get('date')
-                
-                # Convert to datetime for comparison
-                if 'T' in event_start:
-                    event_start_dt = datetime.fromisoformat(event_start.replace('Z', '+00:00'))
-                    event_end_dt = datetime.fromisoformat(event_end.replace('Z', '+00:00'))
-                    requested_start_dt = datetime.fromisoformat(start_time.replace('Z', '+00:00'))
-                    requested_end_dt = datetime.fromisoformat(end_time.replace('Z', '+00:00'))
-                    
-                    # Check for overlap
-                    if (event_start_dt < requested_end_dt and event_end_dt > requested_start_dt):
-                        conflicting_events.append(event)
-            
+            for busy in busy_ranges:
+                # Check for overlap
+                if (_iso_to_ts(busy['start']) < requested_end_ts
+                        and _iso_to_ts(busy['end']) > requested_start_ts):
+                    conflicting_events.append(busy)
+
             is_available = len(conflicting_events) == 0
             
             if is_available:
-                print(f"Time slot {start_time} to {end_time} is available")
+                logger.debug(f"Time slot {start_time} to {end_time} is available")
             else:
-                print(f"Time slot {start_time} to {end_time} has {len(conflicting_events)} conflicts")
+                logger.debug(f"Time slot {start_time} to {end_time} has {len(conflicting_events)} conflicts")
             
             return is_available, conflicting_events
             
         except Exception as e:
-            print(f"Error checking availability: {e}")
+            logger.error(f"Error checking availability: {e}")
             return False, []
     
     def find_available_slots(self, 
@@ -547,7 +1239,7 @@ class CalendarHandler:
             List of available time slots
         """
         if not self.service:
-            print("No service available. Please authenticate first.")
+            logger.error("No service available. Please authenticate first.")
             return []
         
         # Use default calendar if none specified
@@ -558,61 +1250,189 @@ class CalendarHandler:
             # Create time range for the entire day in UTC
             start_of_day = f"{date}T00:00:00.000Z"
             end_of_day = f"{date}T23:59:59.999Z"
-            
-            # Get all events for the day
-            events = self.get_events(start_of_day, end_of_day, calendar_id)
-            
-            # Create busy time ranges
-            busy_ranges = []
-            for event in events:
-                event_start = event.get('start', {}).get('dateTime') or event.get('start', {}).get('date')
-                event_end = event.get('end', {}).get('dateTime') or event.get('end', {}).get('date')
-                
-                if 'T' in event_start:  # Skip all-day events
-                    # Convert to UTC
-                    start_dt = datetime.fromisoformat(event_start.replace('Z', '+00:00'))
-                    end_dt = datetime.fromisoformat(event_end.replace('Z', '+00:00'))
-                    busy_ranges.append((start_dt, end_dt))
-            
-            # Sort busy ranges by start time
-            busy_ranges.sort(key=lambda x: x[0])
-            
+
+            # One freebusy query returns just the busy intervals for the
+            # day, instead of full event payloads via events.list
+            free_busy = self.get_free_busy(start_of_day, end_of_day, [calendar_id])
+            busy = free_busy.get('calendars', {}).get(calendar_id, {}).get('busy', [])
+
+            # Busy intervals as sorted (start, end) epoch pairs; parsing is
+            # memoized and the sweep below is integer arithmetic only
+            busy_ranges = sorted(
+                (_iso_to_ts(interval['start']), _iso_to_ts(interval['end']))
+                for interval in busy
+            )
+
+            # Merge overlapping intervals so the sweep can walk busy blocks
+            # and candidate slots together in one O(S + K) pass instead of
+            # rescanning every busy range per slot
+            merged = []
+            for busy_start, busy_end in busy_ranges:
+                if merged and busy_start <= merged[-1][1]:
+                    if busy_end > merged[-1][1]:
+                        merged[-1][1] = busy_end
+                else:
+                    merged.append([busy_start, busy_end])
+
             # Find available slots
             available_slots = []
-            
-            # Create timezone aware datetime objects
+
+            # Construct the working window directly from the date string;
+            # strptime re-parses its format string on every call
             tz = pytz.UTC
-            current_time = datetime.strptime(f"{date}T{start_hour:02d}:00:00.000Z", "%Y-%m-%dT%H:%M:%S.%fZ").replace(tzinfo=tz)
-            end_time = datetime.strptime(f"{date}T{end_hour:02d}:00:00.000Z", "%Y-%m-%dT%H:%M:%S.%fZ").replace(tzinfo=tz)
-            
-            while current_time + timedelta(minutes=duration_minutes) <= end_time:
-                # Check if this slot conflicts with any busy time
-                slot_available = True
-                slot_end_time = current_time + timedelta(minutes=duration_minutes)
-                
-                for busy_start, busy_end in busy_ranges:
-                    if (busy_start < slot_end_time and busy_end > current_time):
-                        slot_available = False
-                        break
-                
-                if slot_available:
-                    available_slots.append({
-                        'start_time': current_time.strftime("%Y-%m-%dT%H:%M:%S.000Z"),
-                        'end_time': slot_end_time.strftime("%Y-%m-%dT%H:%M:%S.000Z"),
-                        'duration_minutes': duration_minutes
-                    })
-                
+            year, month, day = int(date[:4]), int(date[5:7]), int(date[8:10])
+            working_start = datetime(year, month, day, start_hour, tzinfo=tz)
+            working_end = datetime(year, month, day, end_hour, tzinfo=tz)
+
+            duration_seconds = duration_minutes * 60
+            grid_seconds = 1800  # candidate slots start every 30 minutes
+            start_ts = int(working_start.timestamp())
+            end_ts = int(working_end.timestamp())
+
+            # Hoisted locals keep the sweep free of repeated global and
+            # attribute lookups
+            n_merged = len(merged)
+            append = available_slots.append
+            fromtimestamp = datetime.fromtimestamp
+
+            slot_ts = start_ts
+            busy_idx = 0
+            while slot_ts + duration_seconds <= end_ts:
+                slot_end_ts = slot_ts + duration_seconds
+
+                # Skip merged busy blocks that end before this slot starts
+                while busy_idx < n_merged and merged[busy_idx][1] <= slot_ts:
+                    busy_idx += 1
+
+                if busy_idx < n_merged and merged[busy_idx][0] < slot_end_ts:
+                    # Every grid slot starting before this block ends also
+                    # conflicts, so jump straight past the block to the next
+                    # grid point instead of testing them one by one
+                    steps = int(-(-(merged[busy_idx][1] - start_ts) // grid_seconds))
+                    slot_ts = start_ts + steps * grid_seconds
+                    continue
+
+                append({
+                    'start_time': f'{fromtimestamp(slot_ts, tz):%Y-%m-%dT%H:%M:%S}.000Z',
+                    'end_time': f'{fromtimestamp(slot_end_ts, tz):%Y-%m-%dT%H:%M:%S}.000Z',
+                    'duration_minutes': duration_minutes
+                })
+
                 # Move to next 30-minute slot
-                current_time += timedelta(minutes=30)
+                slot_ts += grid_seconds
             
-            print(f"Found {len(available_slots)} available {duration_minutes}-minute slots on {date}")
+            logger.debug(f"Found {len(available_slots)} available {duration_minutes}-minute slots on {date}")
             return available_slots
             
         except Exception as e:
-            print(f"Error finding available slots: {e}")
+            logger.error(f"Error finding available slots: {e}")
             return []
     
-    def get_free_busy(self, 
+    # Async wrappers over the hot read paths. googleapiclient is synchronous,
+    # so each call runs in a worker thread via asyncio.to_thread; callers on
+    # an event loop can asyncio.gather several of these and overlap the
+    # network I/O instead of serializing it.
+
+    async def aget_calendars(self) -> List[Dict]:
+        """Async wrapper for get_calendars"""
+        return await asyncio.to_thread(self.get_calendars)
+
+    async def aget_events(self, *args, **kwargs) -> List[Dict]:
+        """Async wrapper for get_events"""
+        return await asyncio.to_thread(self.get_events, *args, **kwargs)
+
+    async def acheck_availability(self, *args, **kwargs) -> Tuple[bool, List[Dict]]:
+        """Async wrapper for check_availability"""
+        return await asyncio.to_thread(self.check_availability, *args, **kwargs)
+
+    async def afind_available_slots(self, *args, **kwargs) -> List[Dict]:
+        """Async wrapper for find_available_slots"""
+        return await asyncio.to_thread(self.find_available_slots, *args, **kwargs)
+
+    async def aget_free_busy(self, *args, **kwargs) -> Dict:
+        """Async wrapper for get_free_busy"""
+        return await asyncio.to_thread(self.get_free_busy, *args, **kwargs)
+
+    async def check_many_availability(self, slots: List[Tuple[str, str]]) -> List[Tuple[bool, List[Dict]]]:
+        """Check several (start, end) slots concurrently"""
+        return await asyncio.gather(*(
+            self.acheck_availability(start, end) for start, end in slots
+        ))
+
+    async def check_availability_coalesced(self,
+                                           start_time: str,
+                                           end_time: str,
+                                           calendar_id: str = None) -> Tuple[bool, List[Dict]]:
+        """
+        Availability check that fuses bursts into one freebusy query
+
+        Calls arriving within the coalescing window (50 ms, flushed early
+        at 64 pending) are answered by a single query spanning the union
+        of their windows, so a burst of N checks costs one round-trip.
+        Same return shape as check_availability.
+
+        Args:
+            start_time: Start time in ISO format
+            end_time: End time in ISO format
+            calendar_id: Calendar ID (uses default if None)
+
+        Returns:
+            Tuple[bool, List[Dict]]: (is_available, conflicting_events)
+        """
+        if calendar_id is None:
+            calendar_id = self.default_calendar_id
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending_checks.append((start_time, end_time, calendar_id, future))
+
+        if len(self._pending_checks) >= COALESCE_MAX_BATCH:
+            self._flush_pending_checks()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(
+                COALESCE_WINDOW_SECONDS, self._flush_pending_checks
+            )
+
+        return await future
+
+    def _flush_pending_checks(self):
+        """Dispatch every pending coalesced check as one fused query"""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        pending, self._pending_checks = self._pending_checks, []
+        if pending:
+            asyncio.get_running_loop().create_task(
+                self._run_coalesced_checks(pending)
+            )
+
+    async def _run_coalesced_checks(self, pending):
+        """Answer a batch of coalesced checks from one freebusy response"""
+        start_time = min(pending, key=lambda p: _iso_to_ts(p[0]))[0]
+        end_time = max(pending, key=lambda p: _iso_to_ts(p[1]))[1]
+        calendar_ids = sorted({cal_id for _, _, cal_id, _ in pending})
+
+        try:
+            free_busy = await self.aget_free_busy(start_time, end_time, calendar_ids)
+        except Exception as e:
+            logger.error(f"Error in coalesced availability check: {e}")
+            free_busy = {}
+        calendars = free_busy.get('calendars', {})
+
+        for req_start, req_end, cal_id, future in pending:
+            if future.done():
+                continue
+            busy = calendars.get(cal_id, {}).get('busy', [])
+            req_start_ts = _iso_to_ts(req_start)
+            req_end_ts = _iso_to_ts(req_end)
+            conflicts = [
+                interval for interval in busy
+                if _iso_to_ts(interval['start']) < req_end_ts
+                and _iso_to_ts(interval['end']) > req_start_ts
+            ]
+            future.set_result((len(conflicts) == 0, conflicts))
+
+    def get_free_busy(self,
                      start_time: str,
                      end_time: str,
                      calendar_ids: List[str] = None) -> Dict:
@@ -628,27 +1448,66 @@ class CalendarHandler:
             Dict: Free/busy information
         """
         if not self.service:
-            print("No service available. Please authenticate first.")
+            logger.error("No service available. Please authenticate first.")
             return {}
         
         # Use default calendar if none specified
         if calendar_ids is None:
             calendar_ids = [self.default_calendar_id]
-        
-        try:
-            body = {
+
+        # Minute-bucketed key in the same mutation-cleared TTL cache as
+        # events.list: "what's on today" then "when am I free today"
+        # within a session answers from one query
+        cache_key = ('freebusy', start_time[:16], end_time[:16], tuple(calendar_ids))
+        cached = self._events_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        def _query_body(ids):
+            return {
                 'timeMin': start_time,
                 'timeMax': end_time,
-                'items': [{'id': cal_id} for cal_id in calendar_ids]
+                'items': [{'id': cal_id} for cal_id in ids]
             }
-            
-            free_busy_result = self.service.freebusy().query(body=body).execute()
-            return free_busy_result
-            
+
+        try:
+            # Common case: one query covers every requested calendar
+            if len(calendar_ids) <= FREEBUSY_QUERY_LIMIT:
+                result = _execute_with_retry(self.freebusy.query(body=_query_body(calendar_ids)))
+                self._events_cache.set(cache_key, result)
+                return result
+
+            # The API caps each query at 50 calendars, so larger lookups
+            # fan out into chunks run concurrently; wall clock becomes the
+            # slowest chunk instead of the sum. httplib2 connections are
+            # not thread-safe, so each worker executes over its own
+            # authorized connection.
+            def _query_chunk(ids):
+                return _execute_with_retry(self.freebusy.query(body=_query_body(ids)), http=self._fresh_http())
+
+            chunks = [
+                calendar_ids[i:i + FREEBUSY_QUERY_LIMIT]
+                for i in range(0, len(calendar_ids), FREEBUSY_QUERY_LIMIT)
+            ]
+            merged = {}
+            with ThreadPoolExecutor(max_workers=FREEBUSY_MAX_WORKERS) as executor:
+                for response in executor.map(_query_chunk, chunks):
+                    calendars = merged.setdefault('calendars', {})
+                    calendars.update(response.pop('calendars', {}))
+                    for key, value in response.items():
+                        merged.setdefault(key, value)
+            self._events_cache.set(cache_key, merged)
+            return merged
+
         except HttpError as error:
-            print(f"Error fetching free/busy data: {error}")
+            logger.error(f"Error fetching free/busy data: {error}")
             return {}
 
+    def _fresh_http(self):
+        """A new authorized connection for use from a worker thread"""
+        creds = _credentials_cache.get((self.credentials_file, self.token_file))
+        return google_auth_httplib2.AuthorizedHttp(creds, http=httplib2.Http())
+
 def main():
     """
     Example usage of the CalendarHandler
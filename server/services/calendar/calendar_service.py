@@ -3,27 +3,66 @@ Calendar service handling calendar operations
 """
 
 from services.calendar.calendar_handler import CalendarHandler
+from utils.cache.cache_utils import TTLCache
+from config.settings import EVENTS_CACHE_TTL_SECONDS
 
 class CalendarService:
     def __init__(self):
-        """Initialize calendar service"""
+        """Initialize calendar service; authentication is deferred to first use"""
         self.handler = CalendarHandler()
-        try:
-            self.handler.authenticate()
-        except Exception as e:
-            print(f"Error authenticating calendar: {e}")
-            self.handler = None
+        self._auth_attempted = False
+        # Short-TTL cache keyed by (start, end); chat flows re-query the
+        # same window repeatedly, so repeats become dict hits instead of
+        # Google round-trips. Mutations clear it to keep reads fresh.
+        self._events_cache = TTLCache(EVENTS_CACHE_TTL_SECONDS)
+
+    def _ensure_authenticated(self) -> bool:
+        """Authenticate on first use so workers don't pay the OAuth cost at boot.
+
+        The result (success or failure) is remembered, so only the first
+        caller blocks on the token refresh / OAuth flow.
+        """
+        if not self._auth_attempted:
+            self._auth_attempted = True
+            try:
+                if not self.handler.authenticate():
+                    self.handler = None
+            except Exception as e:
+                print(f"Error authenticating calendar: {e}")
+                self.handler = None
+            if self.handler is not None:
+                # Rebind the gate to a constant-True method so every later
+                # call skips the attempted/handler branches entirely
+                self._ensure_authenticated = self._authenticated_ok
+        return self.handler is not None
+
+    def _authenticated_ok(self) -> bool:
+        """Post-auth fast path for _ensure_authenticated"""
+        return True
 
     def is_available(self) -> bool:
         """Check if calendar service is available"""
-        return self.handler is not None
+        return self._ensure_authenticated()
 
     def get_events(self, start_time: str, end_time: str):
         """Get calendar events"""
-        return self.handler.get_events(start_time=start_time, end_time=end_time)
+        cache_key = (start_time, end_time)
+        events = self._events_cache.get(cache_key)
+        if events is None:
+            self._ensure_authenticated()
+            events = self.handler.get_events(start_time=start_time, end_time=end_time)
+            self._events_cache.set(cache_key, events)
+        return events
+
+    def get_calendars(self):
+        """Get all accessible calendars"""
+        self._ensure_authenticated()
+        return self.handler.get_calendars()
 
     def add_event(self, title: str, start_time: str, duration_minutes: int, description: str = ""):
         """Add a new calendar event"""
+        self._ensure_authenticated()
+        self._events_cache.clear()
         return self.handler.add_event(
             title=title,
             start_time=start_time,
@@ -33,8 +72,12 @@ class CalendarService:
 
     def delete_event(self, event_id: str) -> bool:
         """Delete a calendar event"""
+        self._ensure_authenticated()
+        self._events_cache.clear()
         return self.handler.delete_event(event_id)
 
     def update_event(self, event_id: str, **updates) -> bool:
         """Update a calendar event"""
-        return self.handler.update_event(event_id, **updates) 
\ No newline at end of file
+        self._ensure_authenticated()
+        self._events_cache.clear()
+        return self.handler.update_event(event_id, **updates)
\ No newline at end of file
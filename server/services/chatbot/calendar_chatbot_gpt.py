@@ -6,39 +6,268 @@ from services.calendar.calendar_handler import CalendarHandler
 from datetime import datetime, timedelta
 import pytz
 import re
-import os
 from typing import Tuple, List, Dict, Optional
-from openai import OpenAI
-from config.settings import OPENAI_MODEL
+from collections import deque
+import asyncio
+import json
+import math
+import threading
+import time
+import orjson
+import httpx
+from dateutil import parser as dateutil_parser
+from openai import OpenAI, AsyncOpenAI
+from config.settings import (
+    OPENAI_API_KEY,
+    OPENAI_MODEL,
+    OPENAI_EMBEDDING_MODEL,
+    OPENAI_MAX_COMPLETION_TOKENS
+)
 from services.chatbot.prompts.calendar_prompts import (
     SYSTEM_PROMPT,
     FUNCTION_DEFINITIONS,
+    STATIC_PREFIX_MESSAGES,
     HELP_MESSAGE
 )
+from services.chatbot.intent_classifier import classify_intent
+
+# Maximum number of GPT interpretations to keep cached per bot instance
+GPT_CACHE_MAX_SIZE = 256
+
+# Conversation turns kept as context for GPT. A sliding window caps input
+# tokens per request instead of letting history grow without bound.
+HISTORY_MAX_TURNS = 6
+
+# Cosine similarity above which two queries are treated as paraphrases
+SEMANTIC_CACHE_THRESHOLD = 0.95
+
+# Tools safe to serve from a fuzzy (paraphrase) cache hit. Side-effectful
+# tools stay out: a near-miss that maps "delete event abc123" onto a
+# cached "delete event abc124" call would mutate the wrong event, while
+# a mismatched show/find reply is merely unhelpful.
+_READ_ONLY_TOOLS = frozenset({'show_events', 'find_slots'})
+
+# Precompiled patterns for the natural-language date fast path, so common
+# phrases ("tomorrow at 2pm", "today at 3:30 PM") never hit the slower
+# string-splitting or ISO-parsing fallbacks
+RELATIVE_DATE_RE = re.compile(r'\b(today|tomorrow)\b', re.IGNORECASE)
+AT_TIME_RE = re.compile(r'\bat\s+(\d{1,2})(?::(\d{2}))?\s*(am|pm)?', re.IGNORECASE)
+
+# Bulk-delete phrases, collapsed into one compiled alternation so each
+# query is scanned once instead of four substring passes
+_BULK_DELETE_RE = re.compile(
+    r'\b(?:remove|delete|clear|cancel)\s+all\s+events\b', re.IGNORECASE
+)
+
+# Shared OpenAI clients keyed by API key. The web app, chatbot service and
+# CLI each construct a CalendarGPTBot; sharing one client per key means one
+# HTTP connection pool (keep-alive, TLS session reuse) instead of several.
+_openai_clients: Dict[str, Tuple[OpenAI, AsyncOpenAI]] = {}
+
+def _normalize(vec: List[float]) -> Optional[List[float]]:
+    """Unit-normalize an embedding, or None for a zero vector.
+
+    Cached embeddings are stored normalized, so each semantic-cache
+    lookup is one dot product per entry instead of a dot product plus
+    two norms.
+    """
+    norm = math.sqrt(sum(a * a for a in vec))
+    if norm == 0:
+        return None
+    return [a / norm for a in vec]
+
+def _http_pool_kwargs() -> dict:
+    """HTTP settings shared by the sync and async OpenAI transports.
+
+    A bounded keep-alive pool with HTTP/2 multiplexes concurrent
+    completions over a few warm connections to api.openai.com instead of
+    paying a TCP+TLS handshake per burst; the default client pools
+    without bounds and speaks HTTP/1.1 only.
+    """
+    return {
+        "http2": True,
+        "limits": httpx.Limits(max_connections=50, max_keepalive_connections=20),
+        "timeout": httpx.Timeout(30.0, connect=5.0),
+    }
+
+def _fromisoformat_utc(value: str) -> datetime:
+    """Parse an RFC3339 string, rewriting a trailing 'Z' only when present.
+
+    The unconditional replace('Z', '+00:00') at every call site scanned
+    and reallocated the string even for offset-suffixed input; a last-char
+    check plus slice does the rewrite only when actually needed.
+    """
+    if value and value[-1] in 'Zz':
+        value = value[:-1] + '+00:00'
+    return datetime.fromisoformat(value)
+
+def _semantically_cacheable(message) -> bool:
+    """True when a GPT interpretation only routes to read-only tools"""
+    tool_calls = getattr(message, 'tool_calls', None)
+    if not tool_calls:
+        return True
+    return all(call.function.name in _READ_ONLY_TOOLS for call in tool_calls)
+
+def _get_shared_clients(api_key: str) -> Tuple[OpenAI, AsyncOpenAI]:
+    """Get (or create) the process-wide OpenAI client pair for an API key"""
+    clients = _openai_clients.get(api_key)
+    if clients is None:
+        clients = (
+            OpenAI(
+                api_key=api_key,
+                base_url="https://api.openai.com/v1",
+                http_client=httpx.Client(**_http_pool_kwargs())
+            ),
+            AsyncOpenAI(
+                api_key=api_key,
+                base_url="https://api.openai.com/v1",
+                http_client=httpx.AsyncClient(**_http_pool_kwargs())
+            )
+        )
+        _openai_clients[api_key] = clients
+    return clients
 
 class CalendarGPTBot:
+    # Static prompt artifacts, built once at class definition and shared
+    # by every instance. The tools schema never varies per request, and
+    # keeping the system message byte-identical across requests lets the
+    # API reuse its server-side prompt cache (the prefix KV state)
+    # instead of re-processing it every turn.
+    system_prompt = SYSTEM_PROMPT
+    tools = FUNCTION_DEFINITIONS
+    help_message = HELP_MESSAGE
+    _base_messages = STATIC_PREFIX_MESSAGES
+
     def __init__(self, api_key: str):
         """Initialize the chatbot with CalendarHandler and GPT"""
         self.handler = CalendarHandler()
-        self.handler.authenticate()
-        self.client = OpenAI(
-            api_key=api_key,
-            base_url="https://api.openai.com/v1"  # Explicitly set the base URL
-        )
-        
-        # Get local timezone
+        self.client, self.async_client = _get_shared_clients(api_key)
+
+        # Google auth is deferred to the first calendar-touching call via
+        # _ensure_auth(). Construction stays cheap, and help/keyword
+        # replies keep working even while OAuth is temporarily broken.
+        self._authed = False
+        self._auth_lock = threading.Lock()
+
+        # Timezone references resolved once; every per-query path reuses
+        # these instead of re-looking them up
         self.local_timezone = datetime.now().astimezone().tzinfo
-        
-        # Load prompts
-        self.system_prompt = SYSTEM_PROMPT
-        self.tools = FUNCTION_DEFINITIONS
-        self.help_message = HELP_MESSAGE
+        self._utc = pytz.UTC
+
+        # Recent conversation turns (user + assistant pairs). The deque
+        # drops the oldest pair automatically once the window is full.
+        self.history = deque(maxlen=HISTORY_MAX_TURNS * 2)
+
+        # Exact-match cache of GPT interpretations keyed by normalized query.
+        # Tool calls keep relative dates ("today", "tomorrow") which are only
+        # resolved at execution time, so cached entries stay correct across days.
+        self._gpt_cache = {}
+
+        # Semantic cache: list of (embedding, message) pairs checked when the
+        # exact-match cache misses, so paraphrases ("what's on my calendar
+        # today" vs "show today's events") also skip the main GPT call
+        self._semantic_cache = []
+
+        # Structured action awaiting user confirmation. Storing the parsed
+        # parameters means a "yes" executes directly instead of re-parsing
+        # the conversation through another GPT round-trip.
+        self._pending_action = None
+
+        # Running prompt-cache telemetry. OpenAI reports how many prompt
+        # tokens were served from its prefix cache per completion; the
+        # session totals make prefix-busting regressions (a reordered
+        # message, a mutated tools schema) visible immediately.
+        self._prompt_tokens_total = 0
+        self._cached_tokens_total = 0
+
+        # Tool-name → handler dispatch table; adding a tool is one entry
+        # here plus its schema in FUNCTION_DEFINITIONS
+        self._dispatch = {
+            'schedule_event': self.handle_schedule_event,
+            'show_events': self.handle_show_events,
+            'find_slots': self.handle_find_slots,
+            'update_event': self.handle_update_event,
+            'delete_event': self.handle_delete_event,
+        }
+
+    def _ensure_auth(self):
+        """Authenticate the calendar handler once, on first use.
+
+        Double-checked under a lock so concurrent first calls don't race
+        the OAuth flow; after the first success this is a plain boolean
+        read.
+        """
+        if self._authed:
+            return
+        with self._auth_lock:
+            if not self._authed:
+                self.handler.authenticate()
+                self._authed = True
+
+    def _embed_query(self, text: str) -> Optional[List[float]]:
+        """Get an embedding for a query (much cheaper than a chat completion)"""
+        try:
+            response = self.client.embeddings.create(
+                model=OPENAI_EMBEDDING_MODEL,
+                input=text
+            )
+            return response.data[0].embedding
+        except Exception as e:
+            print(f"Error embedding query: {str(e)}")
+            return None
+
+    def _semantic_lookup(self, embedding: List[float]):
+        """Find a cached interpretation for a near-duplicate query"""
+        query = _normalize(embedding)
+        if query is None:
+            return None
+        best_score = 0.0
+        best_message = None
+        for cached_embedding, message in self._semantic_cache:
+            score = sum(a * b for a, b in zip(query, cached_embedding))
+            if score > best_score:
+                best_score = score
+                best_message = message
+        if best_score >= SEMANTIC_CACHE_THRESHOLD:
+            return best_message
+        return None
+
+    def _record_usage(self, response):
+        """Accumulate prompt-cache telemetry from a completion's usage block"""
+        usage = getattr(response, 'usage', None)
+        if usage is None or not usage.prompt_tokens:
+            return
+        details = getattr(usage, 'prompt_tokens_details', None)
+        cached = getattr(details, 'cached_tokens', None) or 0
+        self._prompt_tokens_total += usage.prompt_tokens
+        self._cached_tokens_total += cached
+        print(
+            f"DEBUG - Prompt cache: {cached}/{usage.prompt_tokens} tokens cached "
+            f"(session hit rate {self._cached_tokens_total / self._prompt_tokens_total:.0%})"
+        )
+
+    def _record_turn(self, query: str, response: str):
+        """Append a user/assistant pair to the sliding history window"""
+        self.history.append({"role": "user", "content": query})
+        self.history.append({"role": "assistant", "content": response})
 
     def _get_gpt_response(self, user_message: str) -> dict:
         """Get structured response from GPT"""
+        # Check the exact-match cache first to skip the API round-trip
+        cache_key = user_message.strip().lower()
+        cached = self._gpt_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        # Fall back to the semantic cache for paraphrased repeats
+        embedding = self._embed_query(cache_key) if self._semantic_cache or self._gpt_cache else None
+        if embedding is not None:
+            cached = self._semantic_lookup(embedding)
+            if cached is not None:
+                return cached
+
         try:
-            messages = [
-                {"role": "system", "content": self.system_prompt},
+            messages = self._base_messages + list(self.history) + [
                 {"role": "user", "content": user_message}
             ]
             
@@ -46,15 +275,37 @@ class CalendarGPTBot:
                 model=OPENAI_MODEL,
                 messages=messages,
                 tools=self.tools,
-                tool_choice="auto"
+                tool_choice="auto",
+                temperature=0,
+                max_tokens=OPENAI_MAX_COMPLETION_TOKENS,
+                parallel_tool_calls=False
             )
-            
+
             # Get the first choice's message
+            self._record_usage(response)
             message = response.choices[0].message
-            
+
             # Debug print
             print(f"DEBUG - GPT Response: {message}")
-            
+
+            # Cache the interpretation, evicting the oldest entry when full
+            if len(self._gpt_cache) >= GPT_CACHE_MAX_SIZE:
+                self._gpt_cache.pop(next(iter(self._gpt_cache)))
+            self._gpt_cache[cache_key] = message
+
+            # Also record the embedding so future paraphrases can hit —
+            # but only for read-only interpretations, where a fuzzy match
+            # can't execute a mutation with the wrong arguments
+            if not _semantically_cacheable(message):
+                return message
+            if embedding is None:
+                embedding = self._embed_query(cache_key)
+            normalized = _normalize(embedding) if embedding is not None else None
+            if normalized is not None:
+                if len(self._semantic_cache) >= GPT_CACHE_MAX_SIZE:
+                    self._semantic_cache.pop(0)
+                self._semantic_cache.append((normalized, message))
+
             return message
             
         except Exception as e:
@@ -64,45 +315,24 @@ class CalendarGPTBot:
     def _parse_datetime(self, date_str: str) -> str:
         """Convert various date formats to RFC3339 UTC format"""
         try:
-            # Handle "tomorrow", "today", etc. with time
-            if 'tomorrow' in date_str.lower():
-                base_date = datetime.now(self.local_timezone) + timedelta(days=1)
-                # Check if time is specified (e.g., "tomorrow at 2pm")
-                if 'at' in date_str.lower():
-                    time_part = date_str.lower().split('at')[1].strip()
-                    # Convert 12-hour format to 24-hour
-                    if 'pm' in time_part:
-                        hour = int(time_part.replace('pm', '').strip())
-                        hour = hour if hour == 12 else hour + 12
-                        base_date = base_date.replace(hour=hour, minute=0)
-                    elif 'am' in time_part:
-                        hour = int(time_part.replace('am', '').strip())
-                        hour = 0 if hour == 12 else hour
-                        base_date = base_date.replace(hour=hour, minute=0)
-                    else:
-                        # Assume 24-hour format
-                        hour = int(time_part.strip())
-                        base_date = base_date.replace(hour=hour, minute=0)
-                else:
-                    # If no time specified, use current time
-                    base_date = base_date.replace(hour=datetime.now(self.local_timezone).hour, 
-                                               minute=datetime.now(self.local_timezone).minute)
-            elif 'today' in date_str.lower():
+            # Fast path: "today"/"tomorrow" with an optional "at <time>" clause
+            relative_match = RELATIVE_DATE_RE.search(date_str)
+            if relative_match:
                 base_date = datetime.now(self.local_timezone)
-                # Similar time parsing as above
-                if 'at' in date_str.lower():
-                    time_part = date_str.lower().split('at')[1].strip()
-                    if 'pm' in time_part:
-                        hour = int(time_part.replace('pm', '').strip())
+                if relative_match.group(1).lower() == 'tomorrow':
+                    base_date += timedelta(days=1)
+
+                time_match = AT_TIME_RE.search(date_str)
+                if time_match:
+                    hour = int(time_match.group(1))
+                    minute = int(time_match.group(2) or 0)
+                    meridiem = (time_match.group(3) or '').lower()
+                    if meridiem == 'pm':
                         hour = hour if hour == 12 else hour + 12
-                        base_date = base_date.replace(hour=hour, minute=0)
-                    elif 'am' in time_part:
-                        hour = int(time_part.replace('am', '').strip())
+                    elif meridiem == 'am':
                         hour = 0 if hour == 12 else hour
-                        base_date = base_date.replace(hour=hour, minute=0)
-                    else:
-                        hour = int(time_part.strip())
-                        base_date = base_date.replace(hour=hour, minute=0)
+                    base_date = base_date.replace(hour=hour, minute=minute)
+                # If no time specified, keep the current clock time
             else:
                 # Try to parse the provided date string
                 try:
@@ -112,11 +342,19 @@ class CalendarGPTBot:
                         # If no timezone was specified, assume local time
                         base_date = base_date.replace(tzinfo=self.local_timezone)
                 except ValueError:
-                    # If that fails, try parsing as UTC
-                    base_date = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
+                    try:
+                        # If that fails, try parsing as UTC
+                        base_date = _fromisoformat_utc(date_str)
+                    except ValueError:
+                        # Last resort: dateutil accepts the natural forms
+                        # fromisoformat rejects ("March 5 at 3pm",
+                        # "next friday 14:00")
+                        base_date = dateutil_parser.parse(date_str, fuzzy=True)
+                        if base_date.tzinfo is None:
+                            base_date = base_date.replace(tzinfo=self.local_timezone)
             
             # Convert to UTC
-            utc_date = base_date.astimezone(pytz.UTC)
+            utc_date = base_date.astimezone(self._utc)
             return utc_date.strftime('%Y-%m-%dT%H:%M:%S.000Z')
         except Exception as e:
             print(f"Date parsing error: {e}")
@@ -125,7 +363,7 @@ class CalendarGPTBot:
     def _format_event_time(self, time_str: str) -> str:
         """Format event time for display"""
         try:
-            dt = datetime.fromisoformat(time_str.replace('Z', '+00:00'))
+            dt = _fromisoformat_utc(time_str)
             local_dt = dt.astimezone(self.local_timezone)  # Convert to local time
             return local_dt.strftime("%B %d, %Y at %I:%M %p")
         except:
@@ -134,11 +372,14 @@ class CalendarGPTBot:
     def handle_schedule_event(self, params: dict) -> str:
         """Handle scheduling new events"""
         try:
+            self._ensure_auth()
             event_id = self.handler.add_event(
                 title=params['title'],
                 start_time=self._parse_datetime(params['start_time']),
                 duration_minutes=params['duration_minutes'],
-                description=params.get('description', '')
+                description=params.get('description', ''),
+                location=params.get('location', ''),
+                attendees=params.get('attendees')
             )
             
             if event_id:
@@ -156,22 +397,23 @@ class CalendarGPTBot:
     def handle_show_events(self, params: dict) -> str:
         """Handle showing calendar events"""
         try:
+            self._ensure_auth()
             # Convert times to proper format
             start_time = self._parse_datetime(params['start_time'])
             end_time = self._parse_datetime(params['end_time'])
             
-            # Get current time for comparison
-            current_time = datetime.now(pytz.UTC).strftime('%Y-%m-%dT%H:%M:%S.000Z')
-            current_dt = datetime.fromisoformat(current_time.replace('Z', '+00:00'))
-            start_dt = datetime.fromisoformat(start_time.replace('Z', '+00:00'))
-            end_dt = datetime.fromisoformat(end_time.replace('Z', '+00:00'))
-            
+            # Compare as datetimes; the RFC3339 string is only produced in
+            # the one branch that rewrites the window start
+            current_dt = datetime.now(self._utc)
+            start_dt = _fromisoformat_utc(start_time)
+            end_dt = _fromisoformat_utc(end_time)
+
             # Only show future events unless both start and end are in the past
             # (which indicates user explicitly wants to see past events)
             if start_dt < current_dt and end_dt > current_dt:
-                # If start is in past but end is in future (e.g., "today"), 
+                # If start is in past but end is in future (e.g., "today"),
                 # adjust start to current time to show only future events
-                start_time = current_time
+                start_time = current_dt.strftime('%Y-%m-%dT%H:%M:%S.000Z')
                 adjusted_message = " (showing only upcoming events)"
             elif start_dt < current_dt and end_dt <= current_dt:
                 # Both start and end are in past - user wants past events, keep as-is
@@ -212,6 +454,7 @@ class CalendarGPTBot:
     def handle_find_slots(self, params: dict) -> str:
         """Handle finding available time slots"""
         try:
+            self._ensure_auth()
             # Convert date string to proper format
             if params['date'].lower() == 'tomorrow':
                 date = (datetime.now() + timedelta(days=1)).strftime('%Y-%m-%d')
@@ -220,44 +463,14 @@ class CalendarGPTBot:
             else:
                 date = params['date']
 
-            # Create time range for the entire day
-            start_of_day = f"{date}T00:00:00.000Z"
-            end_of_day = f"{date}T23:59:59.999Z"
-            
-            # Get all events for the day
-            events = self.handler.get_events(
-                start_time=start_of_day,
-                end_time=end_of_day
+            # Delegate to the handler's slot search: one freebusy query
+            # and a merged-interval sweep over epoch ints, instead of
+            # re-parsing every event's times per candidate slot here
+            slots = self.handler.find_available_slots(
+                date=date,
+                duration_minutes=params['duration_minutes']
             )
-            
-            # Find available slots
-            slots = []
-            current_time = datetime.strptime(f"{date}T09:00:00.000Z", "%Y-%m-%dT%H:%M:%S.%fZ")
-            end_time = datetime.strptime(f"{date}T17:00:00.000Z", "%Y-%m-%dT%H:%M:%S.%fZ")
-            duration = timedelta(minutes=params['duration_minutes'])
-            
-            while current_time + duration <= end_time:
-                slot_end = current_time + duration
-                
-                # Check if slot conflicts with any event
-                is_available = True
-                for event in events:
-                    event_start = datetime.fromisoformat(event['start']['dateTime'].replace('Z', '+00:00'))
-                    event_end = datetime.fromisoformat(event['end']['dateTime'].replace('Z', '+00:00'))
-                    
-                    if (event_start < slot_end and event_end > current_time):
-                        is_available = False
-                        break
-                
-                if is_available:
-                    slots.append({
-                        'start_time': current_time.strftime("%Y-%m-%dT%H:%M:%S.000Z"),
-                        'end_time': slot_end.strftime("%Y-%m-%dT%H:%M:%S.000Z")
-                    })
-                
-                # Move to next 30-minute slot
-                current_time += timedelta(minutes=30)
-            
+
             if not slots:
                 return f"No available {params['duration_minutes']}-minute slots found for {date}."
             
@@ -279,6 +492,7 @@ class CalendarGPTBot:
     def handle_update_event(self, params: dict) -> str:
         """Handle updating events"""
         try:
+            self._ensure_auth()
             updates = {}
             if 'title' in params:
                 updates['title'] = params['title']
@@ -303,6 +517,7 @@ class CalendarGPTBot:
     def handle_delete_event(self, params: dict) -> str:
         """Handle deleting events"""
         try:
+            self._ensure_auth()
             success = self.handler.delete_event(params['event_id'])
             
             if success:
@@ -316,6 +531,7 @@ class CalendarGPTBot:
     def handle_bulk_delete(self, start_time: str, end_time: str) -> str:
         """Handle deleting multiple events in a time range"""
         try:
+            self._ensure_auth()
             # First get all events in the range
             events = self.handler.get_events(
                 start_time=self._parse_datetime(start_time),
@@ -324,14 +540,13 @@ class CalendarGPTBot:
             
             if not events:
                 return "No events found in the specified time period."
-            
-            # Delete each event
-            deleted_count = 0
-            for event in events:
-                event_id = event.get('id')
-                if event_id and self.handler.delete_event(event_id):
-                    deleted_count += 1
-            
+
+            # One batched request deletes them all (chunked at Google's
+            # 50-call cap) instead of a serial round-trip per event
+            event_ids = [event['id'] for event in events if event.get('id')]
+            results = self.handler.delete_events_batch(event_ids)
+            deleted_count = sum(1 for deleted in results.values() if deleted)
+
             if deleted_count > 0:
                 return f"[SUCCESS] Successfully deleted {deleted_count} event{'s' if deleted_count > 1 else ''}"
             else:
@@ -341,70 +556,458 @@ class CalendarGPTBot:
             print(f"Error in bulk delete: {e}")
             return f"Error deleting events: {str(e)}"
 
+    def _handle_confirmation(self, query_lower: str) -> Optional[str]:
+        """Resolve a yes/no reply against the stored pending action"""
+        if self._pending_action is None:
+            return None
+        if query_lower in ['yes', 'y', 'confirm', 'ok']:
+            action = self._pending_action
+            self._pending_action = None
+            if action['action'] == 'bulk_delete':
+                return self.handle_bulk_delete(action['start_time'], action['end_time'])
+            return "Sorry, I lost track of what to confirm. Please repeat your request."
+        if query_lower in ['no', 'n', 'cancel']:
+            self._pending_action = None
+            return "Okay, cancelled. Nothing was changed."
+        return None
+
     def process_query(self, query: str) -> str:
         """Process user query using GPT and execute calendar operations"""
+        query_lower = query.lower().strip()
+
+        # Resolve pending confirmations from the stored structured action
+        confirmation = self._handle_confirmation(query_lower)
+        if confirmation is not None:
+            return confirmation
+
         # Handle bulk delete requests directly without GPT
-        query_lower = query.lower()
-        if any(phrase in query_lower for phrase in [
-            "remove all events",
-            "delete all events",
-            "clear all events",
-            "cancel all events"
-        ]):
-            # Extract time period
+        if _BULK_DELETE_RE.search(query_lower):
+            # Stage the parsed time range and ask for confirmation; the
+            # follow-up "yes" runs straight from this dict without GPT
             if "tomorrow" in query_lower:
-                tomorrow = (datetime.now() + timedelta(days=1)).strftime('%Y-%m-%d')
-                start_time = f"{tomorrow}T00:00:00Z"
-                end_time = f"{tomorrow}T23:59:59Z"
-                return self.handle_bulk_delete(start_time, end_time)
+                day_label = "tomorrow"
+                day = (datetime.now() + timedelta(days=1)).strftime('%Y-%m-%d')
             elif "today" in query_lower:
-                today = datetime.now().strftime('%Y-%m-%d')
-                start_time = f"{today}T00:00:00Z"
-                end_time = f"{today}T23:59:59Z"
-                return self.handle_bulk_delete(start_time, end_time)
-        
+                day_label = "today"
+                day = datetime.now().strftime('%Y-%m-%d')
+            else:
+                day_label = None
+
+            if day_label:
+                self._pending_action = {
+                    'action': 'bulk_delete',
+                    'start_time': f"{day}T00:00:00Z",
+                    'end_time': f"{day}T23:59:59Z"
+                }
+                return f"This will delete all events {day_label}. Reply 'yes' to confirm or 'no' to cancel."
+
         if query.lower() in ['help', '?']:
             return self.help_message
-        
+
+        # Let the local classifier route unambiguous queries without GPT
+        local = self._route_local_intent(query)
+        if local is not None:
+            return local
+
         try:
             # Get GPT's interpretation of the query
             response = self._get_gpt_response(query)
+            result = self._dispatch_response(response)
+            self._record_turn(query, result)
+            return result
+
+        except Exception as e:
+            print(f"Error in process_query: {str(e)}")
+            return "Something went wrong. Please try again or type 'help' for examples."
+
+    def _route_local_intent(self, query: str) -> Optional[str]:
+        """Answer a locally classified query without GPT; None when unsure.
+
+        Shared by the sync, async and streaming paths so every entry
+        point skips the GPT round-trip for the same query shapes.
+        """
+        intent = classify_intent(query)
+        if intent is None:
+            return None
+        name, params = intent
+        if name == 'help':
+            return self.help_message
+        if name == 'greeting':
+            return "Hello! I can help you manage your calendar. Type 'help' to see what I can do."
+        if name == 'show_events':
+            return self.handle_show_events(params)
+        if name == 'find_slots':
+            return self.handle_find_slots(params)
+        return None
+
+    async def aprocess_query(self, query: str) -> str:
+        """Async version of process_query for use from an event loop.
+
+        The GPT call goes through AsyncOpenAI so it doesn't block the loop,
+        and the Google Calendar work (which uses the synchronous
+        googleapiclient) runs in a worker thread so concurrent chat turns
+        overlap their network I/O instead of serializing.
+        """
+        query_lower = query.lower()
+        if self._pending_action is not None or _BULK_DELETE_RE.search(query_lower):
+            return await asyncio.to_thread(self.process_query, query)
+
+        if query.lower() in ['help', '?']:
+            return self.help_message
+
+        # Same local routing as the sync path; the matched handlers do
+        # blocking calendar I/O, so they run in a worker thread
+        local = await asyncio.to_thread(self._route_local_intent, query)
+        if local is not None:
+            return local
+
+        try:
+            response = await self._aget_gpt_response(query)
+            result = await asyncio.to_thread(self._dispatch_response, response)
+            self._record_turn(query, result)
+            return result
+
+        except Exception as e:
+            print(f"Error in aprocess_query: {str(e)}")
+            return "Something went wrong. Please try again or type 'help' for examples."
+
+    async def _aget_gpt_response(self, user_message: str):
+        """Async twin of _get_gpt_response sharing the same caches"""
+        cache_key = user_message.strip().lower()
+        cached = self._gpt_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        embedding = None
+        if self._semantic_cache or self._gpt_cache:
+            embedding = await asyncio.to_thread(self._embed_query, cache_key)
+            if embedding is not None:
+                cached = self._semantic_lookup(embedding)
+                if cached is not None:
+                    return cached
+
+        try:
+            messages = self._base_messages + list(self.history) + [
+                {"role": "user", "content": user_message}
+            ]
+
+            response = await self.async_client.chat.completions.create(
+                model=OPENAI_MODEL,
+                messages=messages,
+                tools=self.tools,
+                tool_choice="auto",
+                temperature=0,
+                max_tokens=OPENAI_MAX_COMPLETION_TOKENS,
+                parallel_tool_calls=False
+            )
+
+            self._record_usage(response)
+            message = response.choices[0].message
+
+            if len(self._gpt_cache) >= GPT_CACHE_MAX_SIZE:
+                self._gpt_cache.pop(next(iter(self._gpt_cache)))
+            self._gpt_cache[cache_key] = message
+
+            if not _semantically_cacheable(message):
+                return message
+            if embedding is None:
+                embedding = await asyncio.to_thread(self._embed_query, cache_key)
+            normalized = _normalize(embedding) if embedding is not None else None
+            if normalized is not None:
+                if len(self._semantic_cache) >= GPT_CACHE_MAX_SIZE:
+                    self._semantic_cache.pop(0)
+                self._semantic_cache.append((normalized, message))
+
+            return message
+
+        except Exception as e:
+            print(f"Error getting GPT response: {str(e)}")
+            return None
+
+    async def aprocess_query_stream(self, query: str):
+        """Stream the reply for a query as text chunks.
+
+        Plain-text GPT replies are yielded token-by-token as they arrive, so
+        first-token latency is the model's, not the full completion's. Tool
+        calls can't produce output until they're executed, so those replies
+        (and local shortcuts like help or cache hits) arrive as one chunk.
+        """
+        query_lower = query.lower().strip()
+        if (self._pending_action is not None or query_lower in ['help', '?']
+                or _BULK_DELETE_RE.search(query_lower)):
+            yield await asyncio.to_thread(self.process_query, query)
+            return
+
+        # Locally routable queries arrive as one chunk, like cache hits
+        local = await asyncio.to_thread(self._route_local_intent, query)
+        if local is not None:
+            yield local
+            return
+
+        cached = self._gpt_cache.get(query_lower)
+        if cached is not None:
+            result = await asyncio.to_thread(self._dispatch_response, cached)
+            self._record_turn(query, result)
+            yield result
+            return
+
+        try:
+            messages = self._base_messages + list(self.history) + [
+                {"role": "user", "content": query}
+            ]
+
+            stream = await self.async_client.chat.completions.create(
+                model=OPENAI_MODEL,
+                messages=messages,
+                tools=self.tools,
+                tool_choice="auto",
+                temperature=0,
+                max_tokens=OPENAI_MAX_COMPLETION_TOKENS,
+                parallel_tool_calls=False,
+                stream=True
+            )
+
+            content_parts = []
+            tool_calls: Dict[int, dict] = {}
+            async for chunk in stream:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta
+                if delta.content:
+                    content_parts.append(delta.content)
+                    yield delta.content
+                for tc in delta.tool_calls or []:
+                    entry = tool_calls.setdefault(tc.index, {'name': '', 'arguments': []})
+                    if tc.function and tc.function.name:
+                        entry['name'] = tc.function.name
+                    if tc.function and tc.function.arguments:
+                        entry['arguments'].append(tc.function.arguments)
+
+            if tool_calls:
+                call = tool_calls[min(tool_calls)]
+                result = await asyncio.to_thread(
+                    self._execute_function, call['name'], ''.join(call['arguments'])
+                )
+                self._record_turn(query, result)
+                yield result
+            elif content_parts:
+                self._record_turn(query, ''.join(content_parts))
+            else:
+                yield "I'm not sure how to help with that. Type 'help' to see what I can do."
+
+        except Exception as e:
+            print(f"Error in aprocess_query_stream: {str(e)}")
+            yield "Something went wrong. Please try again or type 'help' for examples."
+
+    def _execute_tool_call(self, tool_call) -> str:
+        """Run a single GPT tool call through the matching handler"""
+        return self._execute_function(tool_call.function.name, tool_call.function.arguments)
+
+    def _execute_function(self, function_name: str, arguments: str) -> str:
+        """Run one named function call (JSON argument string) through its handler"""
+        try:
+            # Tool arguments are strict JSON; orjson decodes them in
+            # native code (eval here invoked the full Python compiler per
+            # call and would execute anything the model emitted)
+            function_args = orjson.loads(arguments)
+
+            # Call appropriate handler
+            handler = self._dispatch.get(function_name)
+            if handler is None:
+                return f"I don't know how to handle the operation: {function_name}. Please try rephrasing your request."
+            return handler(function_args)
+        except Exception as e:
+            print(f"Error processing function call: {str(e)}")
+            return "I understood your request but had trouble processing it. Please try again or rephrase your request."
+
+    def process_queries(self, queries: List[str]) -> List[str]:
+        """Process a batch of queued queries, sharing one GPT call when possible.
+
+        Queries that never need GPT (help, bulk deletes, cache hits) are
+        answered directly. The rest are packed into a single numbered prompt
+        and resolved through GPT's parallel tool calls, cutting N round-trips
+        down to one. Falls back to per-query processing if the batch reply
+        doesn't line up.
+        """
+        results: Dict[int, str] = {}
+        pending: List[int] = []
+
+        for i, query in enumerate(queries):
+            query_lower = query.strip().lower()
+            needs_gpt = (
+                query_lower not in ['help', '?'] and
+                query_lower not in self._gpt_cache and
+                not _BULK_DELETE_RE.search(query_lower)
+            )
+            if needs_gpt:
+                pending.append(i)
+            else:
+                results[i] = self.process_query(query)
+
+        if len(pending) == 1:
+            i = pending[0]
+            results[i] = self.process_query(queries[i])
+        elif pending:
+            numbered = "\n".join(
+                f"{n}. {queries[i]}" for n, i in enumerate(pending, 1)
+            )
+            batch_prompt = (
+                "Handle each of the following independent calendar requests. "
+                "Emit exactly one function call per request, in the same order:\n"
+                f"{numbered}"
+            )
+            try:
+                response = self.client.chat.completions.create(
+                    model=OPENAI_MODEL,
+                    messages=self._base_messages + [
+                        {"role": "user", "content": batch_prompt}
+                    ],
+                    tools=self.tools,
+                    tool_choice="auto",
+                    temperature=0
+                )
+                message = response.choices[0].message
+                tool_calls = getattr(message, 'tool_calls', None) or []
+                if len(tool_calls) == len(pending):
+                    for i, tool_call in zip(pending, tool_calls):
+                        results[i] = self._execute_tool_call(tool_call)
+                else:
+                    raise ValueError(
+                        f"Expected {len(pending)} tool calls, got {len(tool_calls)}"
+                    )
+            except Exception as e:
+                print(f"Batch processing failed, falling back to per-query: {str(e)}")
+                for i in pending:
+                    results[i] = self.process_query(queries[i])
+
+        return [results[i] for i in range(len(queries))]
+
+    def build_batch_file(self, queries: List[str]) -> str:
+        """Build a JSONL payload of /v1/chat/completions requests.
+
+        For offline workloads (bulk exports, backfills) the Batch API is half
+        the price of interactive calls and has separate rate limits, at the
+        cost of up-to-24h turnaround.
+        """
+        lines = []
+        for i, query in enumerate(queries):
+            lines.append(json.dumps({
+                "custom_id": f"query-{i}",
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": OPENAI_MODEL,
+                    "messages": self._base_messages + [
+                        {"role": "user", "content": query}
+                    ],
+                    "tools": self.tools,
+                    "tool_choice": "auto",
+                    "temperature": 0,
+                    "max_tokens": OPENAI_MAX_COMPLETION_TOKENS
+                }
+            }))
+        return "\n".join(lines)
+
+    def submit_batch(self, queries: List[str]) -> Optional[str]:
+        """Submit queries through the OpenAI Batch API; returns the batch ID"""
+        try:
+            batch_file = self.client.files.create(
+                file=self.build_batch_file(queries).encode('utf-8'),
+                purpose='batch'
+            )
+            batch = self.client.batches.create(
+                input_file_id=batch_file.id,
+                endpoint='/v1/chat/completions',
+                completion_window='24h'
+            )
+            print(f"Submitted batch {batch.id} with {len(queries)} queries")
+            return batch.id
+        except Exception as e:
+            print(f"Error submitting batch: {str(e)}")
+            return None
+
+    def get_batch_results(self, batch_id: str) -> Optional[List[dict]]:
+        """Fetch parsed results for a completed batch, or None if not ready"""
+        try:
+            batch = self.client.batches.retrieve(batch_id)
+            if batch.status != 'completed':
+                print(f"Batch {batch_id} status: {batch.status}")
+                return None
+            content = self.client.files.content(batch.output_file_id)
+            return [json.loads(line) for line in content.text.splitlines() if line]
+        except Exception as e:
+            print(f"Error fetching batch results: {str(e)}")
+            return None
+
+    def batch_process_queries(self, queries: List[str],
+                              poll_interval: float = 30.0,
+                              max_wait: float = 3600.0) -> Optional[List[str]]:
+        """Run queries through the Batch API end to end: submit, poll, collect.
+
+        Intended for offline flows (nightly recaps, backfills) where latency
+        doesn't matter — batch pricing is half the per-token cost and draws
+        from a separate rate-limit pool, so bulk jobs never starve
+        interactive users. Blocks until the batch completes or `max_wait`
+        elapses; returns replies in query order, or None on failure/timeout.
+        """
+        batch_id = self.submit_batch(queries)
+        if batch_id is None:
+            return None
+
+        deadline = time.monotonic() + max_wait
+        while time.monotonic() < deadline:
+            try:
+                batch = self.client.batches.retrieve(batch_id)
+            except Exception as e:
+                print(f"Error polling batch {batch_id}: {str(e)}")
+                return None
+            if batch.status == 'completed':
+                break
+            if batch.status in ('failed', 'expired', 'cancelled'):
+                print(f"Batch {batch_id} ended with status: {batch.status}")
+                return None
+            time.sleep(poll_interval)
+        else:
+            print(f"Batch {batch_id} not finished after {max_wait:.0f}s")
+            return None
+
+        results = self.get_batch_results(batch_id)
+        if results is None:
+            return None
+
+        # Results arrive in completion order; re-key by custom_id so the
+        # reply list lines up with the input queries.
+        by_id = {}
+        for result in results:
+            message = result['response']['body']['choices'][0]['message']
+            by_id[result['custom_id']] = (
+                message.get('content') or
+                "I'm not sure how to help with that."
+            )
+        return [
+            by_id.get(f"query-{i}", "No response for this query.")
+            for i in range(len(queries))
+        ]
+
+    def _dispatch_response(self, response) -> str:
+        """Execute the calendar operation GPT picked and format the reply"""
+        try:
             if not response:
                 return "I'm having trouble understanding your request. Please try again or type 'help' for examples."
 
             # Check if GPT wants to call a function
             if hasattr(response, 'tool_calls') and response.tool_calls:
-                try:
-                    tool_call = response.tool_calls[0]  # Get the first tool call
-                    function_name = tool_call.function.name
-                    function_args = eval(tool_call.function.arguments)
-                    
-                    # Call appropriate handler
-                    if function_name == 'schedule_event':
-                        return self.handle_schedule_event(function_args)
-                    elif function_name == 'show_events':
-                        return self.handle_show_events(function_args)
-                    elif function_name == 'find_slots':
-                        return self.handle_find_slots(function_args)
-                    elif function_name == 'update_event':
-                        return self.handle_update_event(function_args)
-                    elif function_name == 'delete_event':
-                        return self.handle_delete_event(function_args)
-                    else:
-                        return f"I don't know how to handle the operation: {function_name}. Please try rephrasing your request."
-                except Exception as e:
-                    print(f"Error processing function call: {str(e)}")
-                    return "I understood your request but had trouble processing it. Please try again or rephrase your request."
-            
+                return self._execute_tool_call(response.tool_calls[0])
+
             # If no function call but we have content, return it
             if hasattr(response, 'content') and response.content:
                 return response.content
             
             # If we get here, something went wrong
             return "I'm not sure how to help with that. Type 'help' to see what I can do."
-            
+
         except Exception as e:
-            print(f"Error in process_query: {str(e)}")
+            print(f"Error dispatching response: {str(e)}")
             return "Something went wrong. Please try again or type 'help' for examples."
 
 def main():
@@ -414,8 +1017,9 @@ def main():
     print("Type 'quit' to exit")
     print("=" * 50)
     
-    # Get OpenAI API key from environment variable
-    api_key = os.getenv('OPENAI_API_KEY')
+    # API key resolved once at settings import instead of a per-call
+    # environment lookup
+    api_key = OPENAI_API_KEY
     if not api_key:
         print("Error: OPENAI_API_KEY environment variable not set")
         print("\nTo set up your OpenAI API key:")
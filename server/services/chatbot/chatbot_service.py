@@ -2,8 +2,66 @@
 Chatbot service handling chat operations
 """
 
+import asyncio
+import threading
+import time
+from collections import deque
+
 from services.chatbot.calendar_chatbot_gpt import CalendarGPTBot
-from config.settings import OPENAI_API_KEY
+from config.settings import (
+    OPENAI_API_KEY,
+    OPENAI_MAX_CONCURRENCY,
+    OPENAI_REQUESTS_PER_MINUTE
+)
+
+class RateLimiter:
+    """Sliding-window limiter so parallel chat requests stay within quota"""
+
+    def __init__(self, max_per_minute: int):
+        self.max_per_minute = max_per_minute
+        self.timestamps = deque()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a request slot is available in the current window"""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                while self.timestamps and now - self.timestamps[0] >= 60:
+                    self.timestamps.popleft()
+                if len(self.timestamps) < self.max_per_minute:
+                    self.timestamps.append(now)
+                    return
+                wait = 60 - (now - self.timestamps[0])
+            time.sleep(wait)
+
+# Shared across service instances so the limits apply process-wide even
+# when Flask handles chat requests on multiple threads
+_openai_semaphore = threading.Semaphore(OPENAI_MAX_CONCURRENCY)
+_rate_limiter = RateLimiter(OPENAI_REQUESTS_PER_MINUTE)
+
+# One long-lived event loop (on a daemon thread) for bridging async
+# streaming onto WSGI worker threads. The shared AsyncOpenAI client keeps
+# its httpx connection pool across requests, and pooled connections stay
+# tied to the loop they were opened on — a per-request loop would close
+# that loop and make every later stream fail with "Event loop is closed".
+_stream_loop = None
+_stream_loop_lock = threading.Lock()
+
+def _get_stream_loop() -> asyncio.AbstractEventLoop:
+    """Get the shared streaming loop, starting its thread on first use"""
+    global _stream_loop
+    if _stream_loop is None:
+        with _stream_loop_lock:
+            if _stream_loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=loop.run_forever,
+                    name='chat-stream-loop',
+                    daemon=True
+                ).start()
+                _stream_loop = loop
+    return _stream_loop
 
 class ChatbotService:
     def __init__(self):
@@ -23,5 +81,63 @@ class ChatbotService:
         return self.bot is not None
 
     def process_message(self, message: str) -> str:
-        """Process a chat message"""
-        return self.bot.process_query(message) 
\ No newline at end of file
+        """Process a chat message, bounded by the shared concurrency limits"""
+        _rate_limiter.acquire()
+        with _openai_semaphore:
+            return self.bot.process_query(message)
+
+    def stream_message(self, message: str):
+        """Yield a chat reply in chunks, bounded by the shared limits.
+
+        Bridges the bot's async streaming generator onto the shared
+        background loop so the WSGI app can serve progressive output
+        without an ASGI stack. Plain-text replies arrive token by token;
+        tool-call replies arrive as one chunk once executed.
+        """
+        _rate_limiter.acquire()
+        with _openai_semaphore:
+            loop = _get_stream_loop()
+            chunks = self.bot.aprocess_query_stream(message)
+            try:
+                while True:
+                    try:
+                        yield asyncio.run_coroutine_threadsafe(
+                            chunks.__anext__(), loop
+                        ).result()
+                    except StopAsyncIteration:
+                        break
+            finally:
+                # Close the async generator on its own loop, including
+                # when the client disconnects mid-stream
+                asyncio.run_coroutine_threadsafe(chunks.aclose(), loop).result()
+
+    async def aprocess_message(self, message: str) -> str:
+        """Async counterpart of process_message for event-loop servers.
+
+        The shared limiter and semaphore are thread-based, so they are
+        acquired in a worker thread to keep the loop free; the GPT call
+        itself goes through the bot's AsyncOpenAI path, so one worker can
+        hold many chat turns in flight instead of one per thread.
+        """
+        await asyncio.to_thread(_rate_limiter.acquire)
+        await asyncio.to_thread(_openai_semaphore.acquire)
+        try:
+            return await self.bot.aprocess_query(message)
+        finally:
+            _openai_semaphore.release()
+
+# Process-wide service instance. Constructing ChatbotService builds a
+# CalendarGPTBot, which runs Google OAuth (file I/O, possibly a token
+# refresh over the network) — too expensive to repeat per controller or
+# per request. Lazy so importing this module stays cheap.
+_service = None
+_service_lock = threading.Lock()
+
+def get_chatbot_service() -> ChatbotService:
+    """Get the shared ChatbotService, creating it on first use"""
+    global _service
+    if _service is None:
+        with _service_lock:
+            if _service is None:
+                _service = ChatbotService()
+    return _service
@@ -0,0 +1,75 @@
+"""
+Lightweight keyword-based intent classifier
+
+Classifies high-confidence query shapes locally so the chatbot can skip the
+GPT call (and its latency/cost) for the most common requests. Anything the
+rules aren't sure about returns None and falls through to GPT.
+"""
+
+import re
+from typing import Optional, Tuple
+
+# High-precision patterns only: a false route here would execute the wrong
+# calendar operation, so anything ambiguous must return None.
+GREETING_RE = re.compile(
+    r"^(hi|hello|hey|good (morning|afternoon|evening))[!. ]*$",
+    re.IGNORECASE
+)
+
+SHOW_EVENTS_RE = re.compile(
+    r"^(?:show|list)\s+(?:me\s+)?(?:my\s+)?(?:events?|meetings?|calendar|schedule)"
+    r"(?:\s+for)?\s*(?P<day>today|tomorrow)?\s*$",
+    re.IGNORECASE
+)
+
+WHATS_ON_RE = re.compile(
+    r"^(?:what(?:'s| is)\s+on\s+(?:my\s+)?(?:calendar|schedule)"
+    r"|what\s+do\s+i\s+have(?:\s+(?:on|scheduled))?)"
+    r"(?:\s+for)?\s*(?P<day>today|tomorrow)?\s*\??\s*$",
+    re.IGNORECASE
+)
+
+FIND_SLOTS_RE = re.compile(
+    r"^(?:when am i free|find\s+(?:me\s+)?(?:a\s+)?(?:free\s+)?slots?)"
+    r"(?:\s+for)?\s*(?P<day>today|tomorrow)?"
+    r"(?:\s+for\s+(?P<duration>\d+)\s*(?:minutes?|mins?))?\s*$",
+    re.IGNORECASE
+)
+
+# Duration-first phrasing: "find a 30 minute slot tomorrow"
+FIND_SLOTS_DURATION_RE = re.compile(
+    r"^find\s+(?:me\s+)?(?:a\s+)?(?P<duration>\d+)[- ]?(?:minutes?|mins?)\s+"
+    r"(?:free\s+)?slots?\s*(?P<day>today|tomorrow)?\s*$",
+    re.IGNORECASE
+)
+
+def classify_intent(query: str) -> Optional[Tuple[str, dict]]:
+    """Classify a query locally; returns (intent, params) or None if unsure"""
+    text = query.strip()
+
+    if text.lower() in ('help', '?'):
+        return ('help', {})
+
+    if GREETING_RE.match(text):
+        return ('greeting', {})
+
+    match = SHOW_EVENTS_RE.match(text) or WHATS_ON_RE.match(text)
+    if match:
+        day = (match.group('day') or 'today').lower()
+        # Span the full day explicitly: a bare day resolves to the current
+        # clock time, which would silently drop the morning's events
+        return ('show_events', {
+            'start_time': f"{day} at 12:00 AM",
+            'end_time': f"{day} at 11:59 PM"
+        })
+
+    match = FIND_SLOTS_RE.match(text) or FIND_SLOTS_DURATION_RE.match(text)
+    if match:
+        day = (match.group('day') or 'today').lower()
+        duration = int(match.group('duration') or 60)
+        return ('find_slots', {
+            'date': day,
+            'duration_minutes': duration
+        })
+
+    return None
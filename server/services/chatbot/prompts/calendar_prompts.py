@@ -2,47 +2,22 @@
 Calendar chatbot prompts and function definitions
 """
 
-SYSTEM_PROMPT = """You are a calendar management assistant. Your role is to help users manage their calendar events.
-You should always try to use the available functions to help users, even if their request is not perfectly formatted.
+import json
 
-When users ask about events or schedules:
-- Always use the show_events function to check their calendar
-- By default, only future events will be shown (past events are filtered out)
-- If users ask for past events (like "yesterday" or "last week"), both start and end times should be in the past
-- For "tomorrow" or specific dates, set the time range for the full day (00:00 to 23:59)
-- For "this week", set the range from today to end of week
-- For "next week", set the range for the entire next week
+# Kept terse on purpose: this block is re-sent on every completion, so
+# every token here is paid per request. Per-tool guidance lives in the
+# tool descriptions below (already sent with each call), and the exact
+# wording should stay byte-stable so the API's prompt cache keeps hitting.
+SYSTEM_PROMPT = """You are a calendar management assistant. Route every request to one of the available functions, even if it is not perfectly formatted.
 
-When users want to schedule events:
-- ALWAYS use the schedule_event function, not find_slots
-- For requests like "schedule a meeting tomorrow at 2 PM":
-  - title: the event name/purpose
-  - start_time: use the exact time mentioned (e.g., "tomorrow at 2 PM" or "today at 3:30 PM")
-  - duration_minutes: default to 60 if not specified
-- DO NOT convert times to UTC - the system will handle timezone conversion
-- Use the exact time mentioned by the user (e.g., "2 PM" should be "2 PM", not "14:00")
-- Include any provided description or details in the description field
-
-When users ask about availability:
-- Use the find_slots function
-- Default to 60 minutes if duration is not specified
-- For "tomorrow", pass the date parameter as exactly "tomorrow"
-- For "today", pass the date parameter as exactly "today"
-- For specific dates, use YYYY-MM-DD format
-- Ask for clarification if the date is unclear
-
-When users want to delete events:
-- For single event deletion, use delete_event function with the event ID
-- For bulk deletion requests like "remove all events tomorrow", let the system handle it directly
-- Do not try to handle bulk deletions yourself, the system will intercept these requests
-
-Remember:
-- Times should be passed exactly as the user specifies them (e.g., "3 PM", "15:30")
-- DO NOT convert times to UTC or 24-hour format - the system will handle that
-- Dates can be 'today', 'tomorrow', or YYYY-MM-DD
-- Always try to help even if the request is vague
-- Ask for clarification only when absolutely necessary
-- When showing events for "today", only upcoming events will be displayed unless user specifically asks for past events"""
+Rules:
+- Times: verbatim as the user said them ("tomorrow at 2 PM", "3:30 PM"); never convert to UTC or 24-hour format.
+- Dates: today | tomorrow | YYYY-MM-DD.
+- Durations: default 60 minutes.
+- schedule_event for scheduling (never find_slots); find_slots for availability.
+- Bulk deletions ("remove all events tomorrow") are intercepted upstream; never handle them yourself.
+- Past events are filtered automatically; pass a fully past range only when past events are explicitly requested.
+- Help even when the request is vague; clarify only when absolutely necessary."""
 
 FUNCTION_DEFINITIONS = [
     {
@@ -56,7 +31,9 @@ FUNCTION_DEFINITIONS = [
                     "title": {"type": "string", "description": "Title or purpose of the event"},
                     "start_time": {"type": "string", "description": "Event time exactly as specified by user (e.g., 'tomorrow at 2 PM', 'today at 3:30 PM')"},
                     "duration_minutes": {"type": "integer", "description": "Duration of event in minutes (default 60)"},
-                    "description": {"type": "string", "description": "Optional event description or details"}
+                    "description": {"type": "string", "description": "Optional event description or details"},
+                    "location": {"type": "string", "description": "Optional event location"},
+                    "attendees": {"type": "array", "items": {"type": "string"}, "description": "Optional list of attendee email addresses"}
                 },
                 "required": ["title", "start_time", "duration_minutes"]
             }
@@ -66,7 +43,7 @@ FUNCTION_DEFINITIONS = [
         "type": "function",
         "function": {
             "name": "show_events",
-            "description": "Show calendar events for a time period. Use this to view existing events.",
+            "description": "Show calendar events for a time period. Use this to view existing events. For a single day, span 00:00 to 23:59; for 'this week', today through end of week; for 'next week', the entire next week.",
             "parameters": {
                 "type": "object",
                 "properties": {
@@ -81,11 +58,11 @@ FUNCTION_DEFINITIONS = [
         "type": "function",
         "function": {
             "name": "find_slots",
-            "description": "Find available time slots. Use this ONLY when users ask about availability or free time.",
+            "description": "Find available time slots. Use this ONLY when users ask about availability or free time, never for scheduling.",
             "parameters": {
                 "type": "object",
                 "properties": {
-                    "date": {"type": "string", "description": "Date in YYYY-MM-DD format, or 'today', or 'tomorrow'"},
+                    "date": {"type": "string", "description": "Date in YYYY-MM-DD format, or exactly 'today' or 'tomorrow'"},
                     "duration_minutes": {"type": "integer", "description": "Length of slot needed in minutes"}
                 },
                 "required": ["date", "duration_minutes"]
@@ -125,6 +102,21 @@ FUNCTION_DEFINITIONS = [
     }
 ]
 
+# Canonical serialization of the tools schema, computed once at import.
+# Sorted keys and fixed separators make the string byte-identical across
+# processes, so it can serve as a stable cache-key component or a
+# pre-serialized payload without re-dumping the nested dicts per request.
+FUNCTION_DEFINITIONS_JSON = json.dumps(
+    FUNCTION_DEFINITIONS, sort_keys=True, separators=(",", ":")
+)
+
+# The static request prefix, shared by every completion. OpenAI's automatic
+# prefix caching only fires when the leading bytes of a request are identical
+# to a previous one, so this block (with the tools schema) must always come
+# first in the messages list — conversation history and the user turn are
+# appended after it, never interleaved before it.
+STATIC_PREFIX_MESSAGES = [{"role": "system", "content": SYSTEM_PROMPT}]
+
 HELP_MESSAGE = """I can help you manage your calendar! Here are some examples of what you can say:
 
 1. Schedule events:
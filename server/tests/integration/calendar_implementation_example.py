@@ -1,13 +1,15 @@
 #!/usr/bin/env python3
 
 from calendar_handler import CalendarHandler
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 import json
 from pprint import pprint
 
 def format_timestamp(dt):
-    """Format datetime to RFC3339 timestamp"""
-    return dt.strftime('%Y-%m-%dT%H:%M:%S.000Z')
+    """Format an aware UTC datetime to an RFC3339 timestamp"""
+    # isoformat is a C fast path; strftime re-parses its format string
+    # on every call
+    return dt.isoformat(timespec='milliseconds').replace('+00:00', 'Z')
 
 def main():
     print("Calendar Handler Implementation Examples")
@@ -45,7 +47,7 @@ def main():
         print("-" * 20)
 
         # Create timestamps for examples
-        now = datetime.utcnow()  # Use UTC time
+        now = datetime.now(timezone.utc)  # utcnow() is deprecated and naive
         tomorrow = now + timedelta(days=1)
         next_week = now + timedelta(days=7)
         
@@ -118,11 +120,12 @@ def main():
         day_start = format_timestamp(tomorrow_start)
         day_end = format_timestamp(tomorrow_end)
         
-        # Get events for the entire day
+        # Get events for the entire day (capped; a day never needs more)
         events = handler.get_events(
             start_time=day_start,
             end_time=day_end,
-            calendar_id=primary_calendar_id
+            calendar_id=primary_calendar_id,
+            max_results=50
         )
         
         # Print any existing events
@@ -163,16 +166,23 @@ def main():
         print("-" * 20)
         print("\nSaving calendar data to file:")
         
-        # Get events for next week
+        # Get next week's events for every calendar with one batched HTTP
+        # request instead of a round-trip per calendar
         next_week_time = format_timestamp(next_week)
         now_time = format_timestamp(now)
-        
-        events = handler.get_events(
+
+        events_by_calendar = handler.get_events_batch(
+            calendar_ids=[cal['id'] for cal in calendars],
             start_time=now_time,
             end_time=next_week_time,
-            calendar_id=primary_calendar_id
+            max_results=250
         )
-        
+        events = [
+            event
+            for cal_events in events_by_calendar.values()
+            for event in cal_events
+        ]
+
         # Prepare data for storage
         data = {
             'calendars': calendars,
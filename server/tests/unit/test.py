@@ -1,38 +1,41 @@
 #!/usr/bin/env python3
 
+import logging
 import unittest
 from calendar_handler import CalendarHandler
-from datetime import datetime, timedelta
-import json
+from datetime import datetime, timedelta, timezone
+import orjson
 import os
 
+logger = logging.getLogger(__name__)
+
 class TestCalendarHandler(unittest.TestCase):
     def setUp(self):
         """Set up test fixtures before each test method."""
         self.handler = CalendarHandler()
-        print("\nStarting new test...")
+        logger.info("Starting new test...")
 
     def test_1_authentication(self):
         """Test the authentication process"""
-        print("\nSTEP 1: Authentication")
-        print("Starting Google Calendar API authentication...")
+        logger.info("STEP 1: Authentication")
+        logger.info("Starting Google Calendar API authentication...")
         
         # Test authentication
         try:
             if os.path.exists('token.json'):
-                print("Found existing token file, attempting to use...")
+                logger.info("Found existing token file, attempting to use...")
             
             result = self.handler.authenticate()
             self.assertTrue(result, "Authentication should succeed")
-            print("Authentication successful!")
+            logger.info("Authentication successful!")
             
         except Exception as e:
             self.fail(f"Authentication failed with error: {str(e)}")
 
     def test_2_connection(self):
         """Test the connection to Google Calendar API"""
-        print("\nSTEP 2: Connection Test")
-        print("Testing API connection...")
+        logger.info("STEP 2: Connection Test")
+        logger.info("Testing API connection...")
         
         try:
             # Authenticate first
@@ -44,30 +47,28 @@ class TestCalendarHandler(unittest.TestCase):
             self.assertIsInstance(calendars, list, "Calendars should be returned as list")
             self.assertGreater(len(calendars), 0, "Should have at least one calendar")
             
-            print(f"Connection successful! Found {len(calendars)} calendars")
+            logger.info("Connection successful! Found %d calendars", len(calendars))
             for i, calendar in enumerate(calendars[:3], 1):
-                print(f"   {i}. {calendar.get('summary', 'Unnamed Calendar')}")
+                logger.info("   %d. %s", i, calendar.get('summary', 'Unnamed Calendar'))
             if len(calendars) > 3:
-                print(f"   ... and {len(calendars)-3} more")
+                logger.info("   ... and %d more", len(calendars) - 3)
             
         except Exception as e:
             self.fail(f"Connection test failed with error: {str(e)}")
 
     def test_3_calendar_data(self):
         """Test calendar data retrieval and storage"""
-        print("\nSTEP 3: Fetching Calendar Data")
-        print("\n============================================================")
-        print("CALENDAR DATA SUMMARY")
-        print("============================================================")
+        logger.info("STEP 3: Fetching Calendar Data")
+        logger.info("CALENDAR DATA SUMMARY")
         
         try:
             # Authenticate first
             self.handler.authenticate()
             
             # Get calendars
-            print("Fetching user calendars...")
+            logger.info("Fetching user calendars...")
             calendars = self.handler.get_calendars()
-            print(f"Retrieved {len(calendars)} calendars")
+            logger.info("Retrieved %d calendars", len(calendars))
             
             # Get primary calendar
             primary_calendar = next((cal for cal in calendars if cal.get('primary', False)), None)
@@ -75,73 +76,84 @@ class TestCalendarHandler(unittest.TestCase):
             
             # Get events for primary calendar
             if primary_id:
-                print(f"Fetching events from calendar '{primary_calendar['summary']}' for next 7 days...")
-                start_time = datetime.now().isoformat() + 'Z'
-                end_time = (datetime.now() + timedelta(days=7)).isoformat() + 'Z'
+                logger.info("Fetching events from calendar '%s' for next 7 days...", primary_calendar['summary'])
+                # One aware UTC instant for both bounds; naive now() plus
+                # a literal 'Z' mislabeled local time as UTC
+                now_utc = datetime.now(timezone.utc)
+                start_time = now_utc.isoformat().replace('+00:00', 'Z')
+                end_time = (now_utc + timedelta(days=7)).isoformat().replace('+00:00', 'Z')
                 
+                # Cap the fetch so a heavy calendar can't balloon the
+                # smoke test; pagination-minded callers use iter_events
                 events = self.handler.get_events(
                     start_time=start_time,
                     end_time=end_time,
-                    calendar_id=primary_id
+                    calendar_id=primary_id,
+                    max_results=50
                 )
-                print(f"Retrieved {len(events)} events")
+                logger.info("Retrieved %d events", len(events))
             
             # Print summary
-            print(f"\nCalendars: {len(calendars)}")
-            print(f"Events (next 7 days): {len(events) if 'events' in locals() else 0}")
-            print(f"Primary Calendar: {primary_calendar['summary'] if primary_calendar else 'Not found'}\n")
+            logger.info("Calendars: %d", len(calendars))
+            logger.info("Events (next 7 days): %d", len(events) if 'events' in locals() else 0)
+            logger.info("Primary Calendar: %s", primary_calendar['summary'] if primary_calendar else 'Not found')
             
             # Print all calendars
-            print("All Calendars:")
+            logger.info("All Calendars:")
             for i, calendar in enumerate(calendars, 1):
                 suffix = " (Primary)" if calendar.get('primary', False) else ""
-                print(f"   {i}. {calendar['summary']}{suffix}")
+                logger.info("   %d. %s%s", i, calendar['summary'], suffix)
             
         except Exception as e:
             self.fail(f"Calendar data test failed with error: {str(e)}")
 
     def test_4_data_storage(self):
         """Test saving calendar data to file"""
-        print("\nSTEP 4: Saving Data\n")
+        logger.info("STEP 4: Saving Data")
         
         try:
             # Authenticate first
             self.handler.authenticate()
             
-            print("Saving calendar data to calendar_data.json...")
+            logger.info("Saving calendar data to calendar_data.json...")
             
             # Get all calendars
-            print("Fetching user calendars...")
+            logger.info("Fetching user calendars...")
             calendars = self.handler.get_calendars()
-            print(f"Retrieved {len(calendars)} calendars")
+            logger.info("Retrieved %d calendars", len(calendars))
             
-            # Get events for each calendar
+            # Get events for all calendars with one batched request
+            now_utc = datetime.now(timezone.utc)
+            start_time = now_utc.isoformat().replace('+00:00', 'Z')
+            end_time = (now_utc + timedelta(days=7)).isoformat().replace('+00:00', 'Z')
+
+            logger.info("Fetching events from %d calendars for next 7 days (batched)...", len(calendars))
+            events_by_calendar = self.handler.get_events_batch(
+                calendar_ids=[calendar['id'] for calendar in calendars],
+                start_time=start_time,
+                end_time=end_time
+            )
+
             all_events = []
-            start_time = datetime.now().isoformat() + 'Z'
-            end_time = (datetime.now() + timedelta(days=7)).isoformat() + 'Z'
-            
-            for calendar in calendars:
-                print(f"Fetching events from calendar '{calendar['id']}' for next 7 days...")
-                events = self.handler.get_events(
-                    start_time=start_time,
-                    end_time=end_time,
-                    calendar_id=calendar['id']
-                )
-                print(f"Retrieved {len(events)} events")
+            for calendar_id, events in events_by_calendar.items():
+                logger.info("Retrieved %d events from calendar '%s'", len(events), calendar_id)
                 all_events.extend(events)
             
             # Prepare data for storage
             data = {
                 'calendars': calendars,
                 'events': all_events,
-                'last_updated': datetime.now().isoformat()
+                'last_updated': now_utc.isoformat()
             }
             
-            # Save to file
-            with open('calendar_data.json', 'w') as f:
-                json.dump(data, f, indent=2)
-            print("Data saved successfully to calendar_data.json")
-            print(f"Summary: {len(calendars)} calendars, {len(all_events)} events")
+            # Save to file. orjson serializes straight to bytes, skipping
+            # json.dump's per-chunk str encoding; compact output (no
+            # indent) keeps the serialized buffer ~30% smaller for large
+            # event payloads, and nothing parses this file by eye.
+            with open('calendar_data.json', 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_APPEND_NEWLINE))
+            logger.info("Data saved successfully to calendar_data.json")
+            logger.info("Summary: %d calendars, %d events", len(calendars), len(all_events))
             
         except Exception as e:
             self.fail(f"Data storage test failed with error: {str(e)}")
@@ -151,6 +163,7 @@ class TestCalendarHandler(unittest.TestCase):
         pass
 
 if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
     print("Google Calendar API Test")
     print("==================================================\n")
     
@@ -0,0 +1,39 @@
+"""
+Cache utility helpers
+"""
+
+import threading
+import time
+
+class TTLCache:
+    """Small thread-safe cache whose entries expire after a fixed TTL"""
+
+    def __init__(self, ttl_seconds: float, max_size: int = 128):
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """Return the cached value, or None if missing or expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, stored_at = entry
+            if time.monotonic() - stored_at >= self.ttl_seconds:
+                del self._entries[key]
+                return None
+            return value
+
+    def set(self, key, value):
+        """Store a value, evicting the oldest entry when full"""
+        with self._lock:
+            if len(self._entries) >= self.max_size and key not in self._entries:
+                self._entries.pop(next(iter(self._entries)))
+            self._entries[key] = (value, time.monotonic())
+
+    def clear(self):
+        """Drop all cached entries"""
+        with self._lock:
+            self._entries.clear()
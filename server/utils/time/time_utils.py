@@ -2,54 +2,131 @@
 Time utility functions
 """
 
-from datetime import datetime
-import pytz
+from datetime import datetime, timezone
+from functools import lru_cache
+from zoneinfo import ZoneInfo
+import ciso8601
+
+# Timezone objects resolved once at import. ZoneInfo instances are cached,
+# C-backed singletons, so conversions skip the per-call registry lookup and
+# wrapper objects pytz used to build.
+UTC = timezone.utc
+DISPLAY_TZ = ZoneInfo('Asia/Kolkata')
+
+# The display zone's UTC offset, precomputed once. Asia/Kolkata has been a
+# fixed +05:30 with no DST since 1945, so shifting the epoch and formatting
+# as UTC yields the same wall-clock digits as a full astimezone conversion
+# without per-instant tz resolution. Derived from DISPLAY_TZ (not
+# hard-coded) so swapping the zone keeps the offset in sync.
+_DISPLAY_OFFSET_SECONDS = int(DISPLAY_TZ.utcoffset(datetime.now(UTC)).total_seconds())
+
+@lru_cache(maxsize=1024)
+def _format_start_epoch(epoch: int):
+    """Format a start instant (epoch seconds) as (start, day) display strings.
+
+    Keyed on the epoch int rather than the raw ISO string so the same
+    instant spelled differently (offset vs Z) shares one entry, and so the
+    hot path holds ints instead of datetime objects between polls.
+    """
+    d = datetime.fromtimestamp(epoch + _DISPLAY_OFFSET_SECONDS, UTC)
+    # Numeric fields via f-string (no format-string re-parse per call);
+    # the day label keeps strftime for its locale-aware names
+    start_formatted = f'{d.year:04d}-{d.month:02d}-{d.day:02d} {d.hour:02d}:{d.minute:02d}'
+    return start_formatted, d.strftime('%A, %B %d')
+
+@lru_cache(maxsize=1024)
+def _format_end_epoch(epoch: int) -> str:
+    """Format an end instant (epoch seconds) as the HH:MM display string"""
+    d = datetime.fromtimestamp(epoch + _DISPLAY_OFFSET_SECONDS, UTC)
+    return f'{d.hour:02d}:{d.minute:02d}'
+
+@lru_cache(maxsize=512)
+def _format_event_times(start: str, end: str):
+    """Format one event's (start, end) pair for display.
+
+    Memoized because the same timestamps come back on every /api/events
+    poll, so repeat polls skip the parse/astimezone/strftime work. Strings
+    are parsed once to epoch ints, and formatting is memoized per instant —
+    no pytz localize/normalize or intermediate aware datetimes in between.
+    """
+    if start:
+        epoch_start = int(ciso8601.parse_datetime(start).timestamp())
+        start_formatted, day_formatted = _format_start_epoch(epoch_start)
+    else:
+        start_formatted = 'Unknown'
+        day_formatted = 'Unknown'
+
+    if end:
+        end_formatted = _format_end_epoch(int(ciso8601.parse_datetime(end).timestamp()))
+    else:
+        end_formatted = 'Unknown'
+
+    return start_formatted, end_formatted, day_formatted
+
+# Shared sentinel so missing start/end blocks don't allocate a dict per event
+_EMPTY = {}
 
 def format_events_for_display(events):
-    """Format events for frontend display"""
+    """Format events for frontend display.
+
+    The heavy lifting (parse + tz convert + strftime) lives in the memoized
+    per-instant helpers above, so this loop is just dict assembly; lookups
+    are hoisted to locals to keep the per-event interpreter overhead low on
+    large windows.
+
+    A vectorized pandas path (to_datetime + dt.strftime over column
+    Series) was considered for large windows and rejected: repeat polls
+    hit the memo caches and skip the parse/format work entirely, the
+    output must be per-event dicts anyway (json_normalize/to_dict would
+    rebuild them), and pandas would be this server's heaviest import for
+    one display loop.
+    """
     formatted_events = []
+    append = formatted_events.append
+    format_times = _format_event_times
     for event in events:
         try:
-            start = event.get('start', {}).get('dateTime', '')
-            end = event.get('end', {}).get('dateTime', '')
-            
-            # Convert to local time for display
-            if start:
-                start_dt = datetime.fromisoformat(start.replace('Z', '+00:00'))
-                local_start = start_dt.astimezone(pytz.timezone('Asia/Kolkata'))
-                start_formatted = local_start.strftime('%Y-%m-%d %H:%M')
-            else:
-                start_formatted = 'Unknown'
-            
-            if end:
-                end_dt = datetime.fromisoformat(end.replace('Z', '+00:00'))
-                local_end = end_dt.astimezone(pytz.timezone('Asia/Kolkata'))
-                end_formatted = local_end.strftime('%H:%M')
+            get = event.get
+            start = get('start', _EMPTY).get('dateTime', '')
+            end = get('end', _EMPTY).get('dateTime', '')
+
+            # All-day events carry no dateTime at all; there is nothing to
+            # parse, so don't burn memo-cache slots (or a lookup) on them
+            if not start and not end:
+                start_formatted = end_formatted = day_formatted = 'Unknown'
             else:
-                end_formatted = 'Unknown'
-            
-            formatted_events.append({
-                'id': event.get('id', ''),
-                'title': event.get('summary', 'Untitled Event'),
+                start_formatted, end_formatted, day_formatted = format_times(start, end)
+
+            append({
+                'id': get('id', ''),
+                'title': get('summary', 'Untitled Event'),
                 'start': start_formatted,
                 'end': end_formatted,
-                'description': event.get('description', ''),
-                'location': event.get('location', ''),
-                'day': local_start.strftime('%A, %B %d') if start else 'Unknown'
+                'description': get('description', ''),
+                'location': get('location', ''),
+                'day': day_formatted
             })
         except Exception as e:
             print(f"Error formatting event: {e}")
             continue
-    
+
     return formatted_events
 
 def parse_datetime(date_str: str, timezone=None) -> datetime:
     """Parse datetime string to datetime object"""
-    dt = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
+    dt = ciso8601.parse_datetime(date_str)
     if timezone:
         dt = dt.astimezone(timezone)
     return dt
 
 def format_datetime(dt: datetime, format_str: str = '%Y-%m-%dT%H:%M:%S.000Z') -> str:
     """Format datetime object to string"""
-    return dt.strftime(format_str) 
\ No newline at end of file
+    return dt.strftime(format_str)
+
+def to_rfc3339(dt: datetime) -> str:
+    """Format a UTC datetime as the RFC 3339 timestamp Google's API expects.
+
+    isoformat() is a C fast path, unlike strftime which re-parses its
+    format string on every call.
+    """
+    return dt.replace(microsecond=0).isoformat().replace('+00:00', 'Z')
\ No newline at end of file